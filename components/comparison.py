@@ -4,9 +4,15 @@ from utils import (
     create_radar_chart, 
     create_3d_performance_surface,
     create_energy_3d_bars,
-    create_interactive_scaling_animation
+    create_interactive_scaling_animation,
+    create_stored_runs_chart,
+    create_fidelity_decay_chart
 )
 from data.computer_data import COMPUTER_COMPARISONS
+from data.result_store import get_store
+from figures import chart
+import warmup
+from models import noise
 
 def render_comparison():
     st.header("Understanding Quantum vs Classical Computers")
@@ -53,26 +59,72 @@ def render_comparison():
         classical_values = [7, 9, 8, 6, 9, 8, 9]
         quantum_values = [9, 5, 4, 9, 3, 6, 3]
 
+        # Error Rate and Scalability come from the noisy-circuit simulation
+        scores = warmup.fetch(noise.radar_scores)
+        quantum_values[1] = round(scores['Error Rate'], 1)
+        quantum_values[2] = round(scores['Scalability'], 1)
+
         fig = create_radar_chart(categories, classical_values, quantum_values)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(chart(fig), use_container_width=True)
+
+        with st.expander("How the quantum Error Rate and Scalability scores are computed"):
+            st.markdown(f"""
+            A batched density-matrix simulation runs a {noise.ERROR_RATE_CIRCUIT['n_qubits']}-qubit,
+            {noise.ERROR_RATE_CIRCUIT['depth']}-layer circuit with depolarizing, amplitude-damping and
+            dephasing noise at a physical error rate of {scores['error_rate']:g}.
+
+            - **Error Rate**: 10 × final fidelity with the ideal state ({scores['Error Rate']:.1f})
+            - **Scalability**: fitted error of {scores['rate_per_qubit_layer']:.1e} per qubit-layer keeps
+              fidelity above ½ for about {scores['half_fidelity_volume']:.0f} qubit-layers, scored on a log
+              scale against a 433-qubit, 1000-layer circuit ({scores['Scalability']:.1f})
+            """)
+            fig_decay = create_fidelity_decay_chart(*warmup.fetch(noise.fidelity_sweep))
+            st.plotly_chart(chart(fig_decay), use_container_width=True)
+
+            st.markdown("**Simulation cost** (8 noise strengths in one batch)")
+            # Timed on demand in this session, not in the warm-up pool, whose
+            # concurrent builds would inflate the timings
+            if st.button("Measure Simulation Cost"):
+                with st.spinner("Timing noisy-circuit simulations..."):
+                    cost = noise.simulation_cost(tuple(range(2, 9)))
+                st.table({
+                    'Qubits': cost['qubits'],
+                    'ms per layer': (cost['seconds_per_layer'] * 1000).round(2),
+                    'Density matrices (MiB)': (cost['bytes'] / 2**20).round(3),
+                })
 
     with tabs[1]:
         st.subheader("3D Performance Scaling Comparison")
-        fig_3d = create_3d_performance_surface()
-        st.plotly_chart(fig_3d, use_container_width=True)
+        fig_3d = warmup.fetch(create_3d_performance_surface)
+        st.plotly_chart(chart(fig_3d), use_container_width=True)
 
         st.subheader("Interactive Algorithm Scaling")
         algorithm_type = st.selectbox(
             "Select Algorithm Type",
             ["Search", "Factoring"]
         )
-        fig_animation = create_interactive_scaling_animation(algorithm_type)
-        st.plotly_chart(fig_animation, use_container_width=True)
+        fig_animation = warmup.fetch(create_interactive_scaling_animation, algorithm_type)
+        st.plotly_chart(chart(fig_animation), use_container_width=True)
+
+        stored_metrics = get_store().metrics()
+        if stored_metrics:
+            st.subheader("Stored Benchmark Runs")
+            category, metric = st.selectbox(
+                "Select Measurement",
+                stored_metrics,
+                format_func=lambda pair: f"{pair[0].title()}: {pair[1]}"
+            )
+            fig_stored = create_stored_runs_chart(
+                get_store().curves(category, metric),
+                f"Measured {metric} ({category})",
+                metric
+            )
+            st.plotly_chart(chart(fig_stored), use_container_width=True)
 
     with tabs[2]:
         st.subheader("3D Energy Consumption Analysis")
-        fig_energy = create_energy_3d_bars()
-        st.plotly_chart(fig_energy, use_container_width=True)
+        fig_energy = warmup.fetch(create_energy_3d_bars)
+        st.plotly_chart(chart(fig_energy), use_container_width=True)
 
         st.markdown("""
         The 3D visualization above shows energy consumption patterns for both classical and quantum computers
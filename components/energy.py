@@ -1,8 +1,7 @@
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
 from utils import create_comparison_chart
-from data.computer_data import COMPUTER_COMPARISONS
+from figures import make_figure, chart, axis, title
+from models import energy as energy_model
 
 def render_energy_comparison():
     st.header("Energy Consumption Analysis")
@@ -35,29 +34,26 @@ def render_energy_comparison():
             'Computing Tasks',
             'Energy Usage (kWh)'
         )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(chart(fig), use_container_width=True)
 
         # Time-based energy consumption
         st.subheader("24-Hour Energy Profile")
-        times = list(range(24))
-        classical_profile = [COMPUTER_COMPARISONS['energy_baseline']['classical']['idle'] + 
-                           (COMPUTER_COMPARISONS['energy_baseline']['classical']['peak'] - 
-                            COMPUTER_COMPARISONS['energy_baseline']['classical']['idle']) * 
-                           (0.5 + 0.5 * abs(12 - t)/12) for t in times]
-        quantum_profile = [COMPUTER_COMPARISONS['energy_baseline']['quantum']['idle'] + 
-                         (COMPUTER_COMPARISONS['energy_baseline']['quantum']['peak'] - 
-                          COMPUTER_COMPARISONS['energy_baseline']['quantum']['idle']) * 
-                         (0.3 + 0.7 * abs(12 - t)/12) for t in times]
-
-        fig_profile = go.Figure()
-        fig_profile.add_trace(go.Scatter(x=times, y=classical_profile, name='Classical Computer',
-                                       mode='lines', line=dict(color='blue')))
-        fig_profile.add_trace(go.Scatter(x=times, y=quantum_profile, name='Quantum Computer',
-                                       mode='lines', line=dict(color='red')))
-        fig_profile.update_layout(title='24-Hour Energy Consumption Profile',
-                                xaxis_title='Hour of Day',
-                                yaxis_title='Power Consumption (Watts)')
-        st.plotly_chart(fig_profile, use_container_width=True)
+        times = list(range(energy_model.HOURS_PER_DAY))
+        classical_profile = energy_model.baseline_profile('classical')
+        quantum_profile = energy_model.baseline_profile('quantum')
+
+        fig_profile = make_figure(
+            [
+                {'type': 'scatter', 'x': times, 'y': classical_profile, 'name': 'Classical Computer',
+                 'mode': 'lines', 'line': {'color': 'blue'}},
+                {'type': 'scatter', 'x': times, 'y': quantum_profile, 'name': 'Quantum Computer',
+                 'mode': 'lines', 'line': {'color': 'red'}}
+            ],
+            title=title('24-Hour Energy Consumption Profile'),
+            xaxis=axis('Hour of Day'),
+            yaxis=axis('Power Consumption (Watts)')
+        )
+        st.plotly_chart(chart(fig_profile), use_container_width=True)
 
     with tab2:
         st.subheader("Environmental Impact")
@@ -70,24 +66,18 @@ def render_energy_comparison():
 
         energy_source = st.selectbox(
             "Select Primary Energy Source",
-            ["Coal", "Natural Gas", "Nuclear", "Renewable"]
+            list(energy_model.CARBON_FACTORS)
         )
 
-        carbon_factors = {
-            "Coal": 0.995,  # kg CO2/kWh
-            "Natural Gas": 0.535,
-            "Nuclear": 0.029,
-            "Renewable": 0.005
-        }
-
         hours = st.slider("Daily Operation Hours", 1, 24, 8)
 
         # Calculate carbon footprint
-        classical_energy = sum(classical_profile[:hours])/1000  # Convert W to kW
-        quantum_energy = sum(quantum_profile[:hours])/1000
+        classical_energy = energy_model.daily_energy(classical_profile, hours)
+        quantum_energy = energy_model.daily_energy(quantum_profile, hours)
 
-        classical_carbon = classical_energy * carbon_factors[energy_source]
-        quantum_carbon = quantum_energy * carbon_factors[energy_source]
+        carbon_factor = energy_model.CARBON_FACTORS[energy_source]
+        classical_carbon = energy_model.carbon_footprint(classical_energy, carbon_factor)
+        quantum_carbon = energy_model.carbon_footprint(quantum_energy, carbon_factor)
 
         col1, col2 = st.columns(2)
         with col1:
@@ -100,8 +90,8 @@ def render_energy_comparison():
 
         # Cost calculator
         electricity_rate = st.slider("Electricity Rate ($/kWh)", 0.05, 0.50, 0.12, 0.01)
-        daily_cost_classical = classical_energy * electricity_rate
-        daily_cost_quantum = quantum_energy * electricity_rate
+        daily_cost_classical = energy_model.operating_cost(classical_energy, electricity_rate)
+        daily_cost_quantum = energy_model.operating_cost(quantum_energy, electricity_rate)
 
         st.markdown("#### Daily Operating Costs")
         col3, col4 = st.columns(2)
@@ -120,8 +110,11 @@ def render_energy_comparison():
         # Calculate time and cost savings
         task_index = energy_data['categories'].index(task_type)
         classical_time = 100  # baseline hours
-        quantum_time = classical_time * (energy_data['classical'][task_index] / 
-                                       energy_data['quantum'][task_index])
+        quantum_time = energy_model.quantum_task_time(
+            classical_time,
+            energy_data['classical'][task_index],
+            energy_data['quantum'][task_index]
+        )
 
         st.markdown(f"""
         #### Estimated Time Savings
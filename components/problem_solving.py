@@ -1,8 +1,223 @@
+import os
 import streamlit as st
-import plotly.graph_objects as go
-import numpy as np
 from utils import create_comparison_chart
+from figures import make_figure, chart, axis, title
+import warmup
+from models import hamiltonian, resources, statevector
+from models.scaling import compute_algorithm_scaling
 from data.computer_data import COMPUTER_COMPARISONS
+from data.result_store import get_store
+
+def render_hamiltonian_benchmark():
+    st.subheader("Measured: Exact vs Trotterized Hamiltonian Simulation")
+
+    st.markdown("""
+    The curves above are idealised. This benchmark builds spin-chain Hamiltonians as sparse
+    matrices and runs them on this server: exact classical evolution (sparse Krylov
+    `expm_multiply`) against Trotterized evolution that applies one Pauli rotation per
+    term, as a quantum circuit would.
+    """)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        model = st.selectbox("Spin Model", list(hamiltonian.SPIN_MODELS))
+    with col2:
+        max_spins = st.slider("Largest Chain (spins)", 8, 18, 14, 2)
+
+    if not st.button("Run Benchmark"):
+        return
+
+    with st.spinner("Evolving Hamiltonians..."):
+        results = hamiltonian.stored_benchmark_evolution(
+            get_store(), model, range(4, max_spins + 1, 2)
+        )
+    limits = hamiltonian.feasibility_limit(results)
+
+    fig_runtime = make_figure(
+        [
+            {'type': 'scatter', 'x': results['sizes'], 'y': results['exact_seconds'],
+             'name': "Exact (sparse Krylov)", 'line': {'color': 'blue'}},
+            {'type': 'scatter', 'x': results['sizes'], 'y': results['trotter_seconds'],
+             'name': "Trotterized circuit", 'line': {'color': 'red'}}
+        ],
+        title=title(f"Runtime: {model}"),
+        xaxis=axis("Number of Spins"),
+        yaxis=axis("Seconds", type="log")
+    )
+    st.plotly_chart(chart(fig_runtime), use_container_width=True)
+
+    fig_memory = make_figure(
+        [
+            {'type': 'scatter', 'x': results['sizes'], 'y': results['exact_bytes'] / 2**20,
+             'name': "Exact (sparse Krylov)", 'line': {'color': 'blue'}},
+            {'type': 'scatter', 'x': results['sizes'], 'y': results['trotter_bytes'] / 2**20,
+             'name': "Trotterized circuit", 'line': {'color': 'red'}}
+        ],
+        title=title(f"Peak Memory: {model}"),
+        xaxis=axis("Number of Spins"),
+        yaxis=axis("MiB", type="log")
+    )
+    st.plotly_chart(chart(fig_memory), use_container_width=True)
+
+    col3, col4, col5 = st.columns(3)
+    with col3:
+        st.metric("Memory Limit (spins)", limits['memory_limit_spins'])
+    with col4:
+        st.metric("1-Hour Time Limit (spins)", limits['time_limit_spins'])
+    with col5:
+        st.metric("Trotter Infidelity (largest)", f"{results['trotter_infidelity'][-1]:.1e}")
+
+    st.caption(
+        f"Limits are extrapolated from the measured runs against "
+        f"{limits['memory_bytes'] / 2**30:.1f} GiB of memory on this machine. Beyond "
+        f"{limits['limit_spins']} spins exact classical evolution is no longer feasible here, "
+        f"while the circuit's gate count grows only linearly with the chain."
+    )
+
+def render_molecule_benchmark():
+    st.subheader("Measured: Trotter Error for the H₂ Molecule")
+
+    st.markdown("""
+    The hydrogen molecule as a 2-qubit Hamiltonian, evolved from its Hartree-Fock state.
+    More Trotter steps shrink the error of the circuit against exact evolution; the
+    second-order formula converges much faster than the first-order one.
+    """)
+
+    results = hamiltonian.molecule_benchmark('H2')
+    fig_error = make_figure(
+        [
+            {'type': 'scatter', 'x': results['steps'], 'y': results['order1_infidelity'],
+             'name': "First-order Trotter", 'line': {'color': 'orange'}},
+            {'type': 'scatter', 'x': results['steps'], 'y': results['order2_infidelity'],
+             'name': "Second-order Trotter", 'line': {'color': 'red'}}
+        ],
+        title=title("H₂ Trotter Infidelity vs Exact Evolution"),
+        xaxis=axis("Trotter Steps", type="log"),
+        yaxis=axis("Infidelity", type="log")
+    )
+    st.plotly_chart(chart(fig_error), use_container_width=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Hartree-Fock Energy (Ha)", f"{results['hartree_fock_energy']:.4f}")
+    with col2:
+        st.metric("Exact Ground-State Energy (Ha)", f"{results['ground_energy']:.4f}")
+    st.caption("Total energies at a bond length of 0.735 Å, including the nuclear repulsion.")
+
+def render_phase_estimation_demo():
+    st.subheader("Quantum Phase Estimation on a Multi-Core Statevector")
+
+    st.markdown("""
+    Simulates phase estimation of a single-qubit phase gate with a shared-memory statevector
+    whose amplitudes are partitioned by qubit index across worker processes.
+    """)
+
+    cores = os.cpu_count() or 1
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        counting_qubits = st.slider("Counting Qubits", 4, 24, 12)
+    with col2:
+        workers = st.slider("Worker Processes", 1, max(cores, 2), min(cores, 4))
+    with col3:
+        eigenphase = st.number_input("Eigenphase φ", 0.0, 0.999, 0.3125, 0.0001, format="%.4f")
+
+    if st.button("Run Phase Estimation"):
+        try:
+            with st.spinner("Simulating..."):
+                stats = statevector.estimate_phase(counting_qubits, eigenphase, workers)
+        except MemoryError as exc:
+            st.error(str(exc))
+        else:
+            col4, col5, col6, col7 = st.columns(4)
+            with col4:
+                st.metric("Estimated φ", f"{stats['estimate']:.6f}", f"{stats['estimate'] - eigenphase:+.2e}")
+            with col5:
+                st.metric("Run Time", f"{stats['seconds']:.2f} s")
+            with col6:
+                st.metric("Amplitude Updates/s", f"{stats['amplitude_updates_per_second']:.2e}")
+            with col7:
+                st.metric("Memory Passes", stats['passes'], stats['passes'] - stats['gates'], delta_color="inverse")
+            st.caption(
+                f"Gate fusion merges single-qubit gates and runs of commuting phase gates: the "
+                f"{stats['gates']}-gate circuit ran in {stats['passes']} passes over the statevector "
+                f"instead of {stats['gates']}, with {stats['syncs']} worker synchronisations."
+            )
+
+    if st.button("Measure Core Scaling"):
+        try:
+            with st.spinner("Running QFT on 1 to {} workers...".format(cores)):
+                scaling = statevector.throughput_scaling(counting_qubits + 1)
+        except MemoryError as exc:
+            st.error(str(exc))
+            return
+        fig_cores = make_figure(
+            [
+                {'type': 'scatter', 'x': scaling['workers'], 'y': scaling['speedup'],
+                 'name': "Measured speedup", 'mode': 'lines+markers', 'line': {'color': 'blue'}},
+                {'type': 'scatter', 'x': scaling['workers'], 'y': scaling['workers'],
+                 'name': "Linear", 'mode': 'lines', 'line': {'color': 'gray', 'dash': 'dash'}}
+            ],
+            title=title(f"QFT Throughput Scaling ({counting_qubits + 1} qubits)"),
+            xaxis=axis("Worker Processes"),
+            yaxis=axis("Speedup vs Single Process")
+        )
+        st.plotly_chart(chart(fig_cores), use_container_width=True)
+
+def render_resource_estimate(algorithm_type):
+    st.subheader("Hardware Resource Estimate")
+
+    algorithm = resources.ALGORITHMS[algorithm_type]
+    error_correction = st.checkbox("Surface-code error correction", value=True)
+    estimate = resources.estimate_profiles(algorithm_type, error_correction=error_correction)
+
+    colors = ['blue', 'red', 'green']
+    runtime_traces, qubit_traces = [], []
+    for i, profile in enumerate(estimate['profiles']):
+        runtime_traces.append({
+            'type': 'scatter', 'x': estimate['sizes'], 'y': estimate['seconds'][i] / 3600,
+            'name': profile, 'line': {'color': colors[i % len(colors)]}
+        })
+        qubit_traces.append({
+            'type': 'scatter', 'x': estimate['sizes'], 'y': estimate['physical_qubits'][i],
+            'name': profile, 'line': {'color': colors[i % len(colors)]}
+        })
+    qubit_traces.append({
+        'type': 'scatter', 'x': estimate['sizes'][[0, -1]],
+        'y': [COMPUTER_COMPARISONS['processing']['quantum']['qubit_count']] * 2,
+        'name': 'IBM Osprey size', 'mode': 'lines', 'line': {'color': 'gray', 'dash': 'dash'}
+    })
+
+    col1, col2 = st.columns(2)
+    with col1:
+        fig_runtime = make_figure(
+            runtime_traces,
+            title=title(f"{algorithm['name']}: Wall-Clock Time"),
+            xaxis=axis(algorithm['size_label']),
+            yaxis=axis("Hours", type="log")
+        )
+        st.plotly_chart(chart(fig_runtime), use_container_width=True)
+    with col2:
+        fig_qubits = make_figure(
+            qubit_traces,
+            title=title(f"{algorithm['name']}: Physical Qubits"),
+            xaxis=axis(algorithm['size_label']),
+            yaxis=axis("Qubits", type="log")
+        )
+        st.plotly_chart(chart(fig_qubits), use_container_width=True)
+
+    if error_correction:
+        st.caption(
+            "Logical gate counts are mapped onto each hardware profile's gate time and error rate. "
+            "The surface-code distance is chosen to keep the total failure probability under 1%; "
+            "each logical layer takes d syndrome cycles and each logical qubit 2d² physical qubits."
+        )
+    else:
+        success = estimate['success_probability'][:, 0]
+        st.caption(
+            "Without error correction the smallest instance succeeds with probability "
+            + ", ".join(f"{p:.1e} ({name})" for name, p in zip(estimate['profiles'], success))
+            + "."
+        )
 
 def render_problem_solving():
     st.header("Problem-Solving Capabilities")
@@ -31,7 +246,7 @@ def render_problem_solving():
         'Problem Types',
         'Efficiency Score'
     )
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(chart(fig), use_container_width=True)
 
     # Algorithm comparison section
     st.subheader("Algorithm Deep Dive")
@@ -128,51 +343,31 @@ def render_problem_solving():
         **Key Limitations**: {details['limitations']}
         """)
 
+    render_resource_estimate(algorithm_type)
+
     # Scaling visualization
     st.subheader("Algorithm Scaling Comparison")
 
-    problem_size = np.linspace(1, 100, 100)
-    scaling_data = {
-        "Factorization": {
-            "classical": np.exp(np.sqrt(problem_size)),
-            "quantum": np.log(problem_size)**2
-        },
-        "Search": {
-            "classical": problem_size,
-            "quantum": np.sqrt(problem_size)
-        },
-        "Optimization": {
-            "classical": 2**np.sqrt(problem_size),
-            "quantum": problem_size**2
-        },
-        "Simulation": {
-            "classical": 2**problem_size,
-            "quantum": problem_size**3
-        }
-    }
+    problem_size, scaling_data = warmup.fetch(compute_algorithm_scaling)
 
-    fig_scaling = go.Figure()
-    fig_scaling.add_trace(go.Scatter(
-        x=problem_size,
-        y=scaling_data[algorithm_type]["classical"],
-        name="Classical Algorithm",
-        line=dict(color='blue')
-    ))
-    fig_scaling.add_trace(go.Scatter(
-        x=problem_size,
-        y=scaling_data[algorithm_type]["quantum"],
-        name="Quantum Algorithm",
-        line=dict(color='red')
-    ))
-
-    fig_scaling.update_layout(
-        title=f"Algorithm Scaling: {algorithm_type}",
-        xaxis_title="Problem Size",
-        yaxis_title="Computational Resources Required",
-        yaxis_type="log"
+    fig_scaling = make_figure(
+        [
+            {'type': 'scatter', 'x': problem_size, 'y': scaling_data[algorithm_type]["classical"],
+             'name': "Classical Algorithm", 'line': {'color': 'blue'}},
+            {'type': 'scatter', 'x': problem_size, 'y': scaling_data[algorithm_type]["quantum"],
+             'name': "Quantum Algorithm", 'line': {'color': 'red'}}
+        ],
+        title=title(f"Algorithm Scaling: {algorithm_type}"),
+        xaxis=axis("Problem Size"),
+        yaxis=axis("Computational Resources Required", type="log")
     )
 
-    st.plotly_chart(fig_scaling, use_container_width=True)
+    st.plotly_chart(chart(fig_scaling), use_container_width=True)
+
+    if algorithm_type == "Simulation":
+        render_hamiltonian_benchmark()
+        render_molecule_benchmark()
+        render_phase_estimation_demo()
 
     # Case studies section
     st.subheader("Real-World Case Studies")
@@ -22,6 +22,9 @@ COMPUTER_COMPARISONS = {
             'type': 'Quantum Bits (Qubits)',
             'speed': '1-2 μs gate times (IBM Eagle processor)',
             'parallelism': '433 qubits (IBM Osprey, 2023)',
+            # Numeric forms of the figures above, used by the resource estimator
+            'gate_time_range': (1e-6, 2e-6),  # seconds
+            'qubit_count': 433,
             'source': 'IBM Quantum System Specifications, 2023'
         }
     },
@@ -62,6 +65,28 @@ COMPUTER_COMPARISONS = {
     }
 }
 
+# Hardware profiles for gate-level resource estimates. Gate times and the
+# device size come from COMPUTER_COMPARISONS['processing']['quantum']; the
+# physical error rates are assumptions spanning current two-qubit gate errors
+# (~1e-3 to 1e-2) and a projected fault-tolerant regime.
+HARDWARE_PROFILES = {
+    'IBM Osprey, 2 μs gates': {
+        'gate_time': COMPUTER_COMPARISONS['processing']['quantum']['gate_time_range'][1],
+        'error_rate': 3e-3,
+        'qubit_count': COMPUTER_COMPARISONS['processing']['quantum']['qubit_count']
+    },
+    'IBM Osprey, 1 μs gates': {
+        'gate_time': COMPUTER_COMPARISONS['processing']['quantum']['gate_time_range'][0],
+        'error_rate': 1e-3,
+        'qubit_count': COMPUTER_COMPARISONS['processing']['quantum']['qubit_count']
+    },
+    'Projected fault-tolerant': {
+        'gate_time': 1e-6,
+        'error_rate': 1e-4,
+        'qubit_count': 1_000_000
+    }
+}
+
 # Real-world performance metrics based on:
 # - IBM's Eagle and Osprey quantum processors (2023)
 # - Google's Quantum AI benchmarks (2023)
@@ -0,0 +1,161 @@
+"""
+Persistent store for measured and simulated results.
+
+Every result is one metric value for a configuration identified by
+(category, backend, params, problem_size), e.g. the exact-evolution runtime
+of a 12-spin Heisenberg chain. Configurations are unique, so re-inserting a
+stored run is a no-op and callers can ask which sizes are still missing
+before computing anything.
+
+Measured metrics (timings, memory) only compare on the same machine, so
+their params should include host_id().
+
+The database lives at $RESULT_STORE_PATH, defaulting to results.sqlite3 in
+the project root.
+"""
+import json
+import os
+import platform
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'results.sqlite3')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    category TEXT NOT NULL,
+    backend TEXT NOT NULL,
+    params TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    problem_size REAL NOT NULL,
+    value REAL NOT NULL,
+    recorded_at REAL NOT NULL,
+    UNIQUE (category, backend, params, metric, problem_size)
+);
+CREATE INDEX IF NOT EXISTS results_by_metric
+    ON results (category, metric, problem_size);
+"""
+
+
+def canonical_params(params):
+    """Serialize parameters so equal configurations compare equal"""
+    return json.dumps(params or {}, sort_keys=True, separators=(',', ':'))
+
+
+def host_id():
+    """Identify the machine measurements were taken on: host name, architecture and CPU count"""
+    return f"{platform.node()} ({platform.machine()}, {os.cpu_count()} CPUs)"
+
+
+class ResultStore:
+    """SQLite-backed store of (configuration, metric) -> value"""
+
+    def __init__(self, path=None):
+        self.path = path or os.environ.get('RESULT_STORE_PATH', DEFAULT_PATH)
+        self._local = threading.local()
+        with self._transaction() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connection(self):
+        # Streamlit serves sessions from several threads; SQLite connections
+        # must not be shared across them
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._connection()
+        with conn:
+            yield conn
+
+    def insert_many(self, records):
+        """Bulk insert result dicts; configurations already stored are skipped
+
+        Each record has category, backend, problem_size, metric, value and
+        optionally params. Returns the number of new rows.
+        """
+        now = time.time()
+        rows = [
+            (r['category'], r['backend'], canonical_params(r.get('params')), r['metric'],
+             float(r['problem_size']), float(r['value']), now)
+            for r in records
+        ]
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                'INSERT OR IGNORE INTO results '
+                '(category, backend, params, metric, problem_size, value, recorded_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                rows
+            )
+            return conn.total_changes - before
+
+    def missing_sizes(self, category, backend, metric, sizes, params=None):
+        """Return the sizes not yet stored for this configuration"""
+        sizes = list(sizes)
+        stored, _ = self.curve(category, backend, metric, params=params)
+        stored = set(stored.tolist())
+        return [size for size in sizes if float(size) not in stored]
+
+    def curve(self, category, backend, metric, params=None, min_size=None, max_size=None):
+        """Return (sizes, values) arrays for one configuration, ordered by size"""
+        sql = ('SELECT problem_size, value FROM results '
+               'WHERE category = ? AND backend = ? AND params = ? AND metric = ?')
+        args = [category, backend, canonical_params(params), metric]
+        sql, args = _size_range(sql, args, min_size, max_size)
+        rows = self._connection().execute(sql + ' ORDER BY problem_size', args).fetchall()
+        data = np.array(rows, dtype=float).reshape(-1, 2)
+        return data[:, 0], data[:, 1]
+
+    def curves(self, category, metric, min_size=None, max_size=None):
+        """Return {(backend, params): (sizes, values)} for every stored configuration"""
+        sql = ('SELECT backend, params, problem_size, value FROM results '
+               'WHERE category = ? AND metric = ?')
+        sql, args = _size_range(sql, [category, metric], min_size, max_size)
+        grouped = {}
+        for backend, params, size, value in self._connection().execute(
+                sql + ' ORDER BY backend, params, problem_size', args):
+            grouped.setdefault((backend, params), []).append((size, value))
+        return {
+            key: (np.array([s for s, _ in rows]), np.array([v for _, v in rows]))
+            for key, rows in grouped.items()
+        }
+
+    def metrics(self):
+        """Return the stored (category, metric) pairs"""
+        return self._connection().execute(
+            'SELECT DISTINCT category, metric FROM results ORDER BY category, metric'
+        ).fetchall()
+
+
+def _size_range(sql, args, min_size, max_size):
+    if min_size is not None:
+        sql += ' AND problem_size >= ?'
+        args.append(float(min_size))
+    if max_size is not None:
+        sql += ' AND problem_size <= ?'
+        args.append(float(max_size))
+    return sql, args
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """Return the process-wide result store"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ResultStore()
+        return _store
@@ -0,0 +1,142 @@
+"""
+Validation-free construction of Plotly figures.
+
+Building `go.Figure`/`go.Scatter` objects validates every property on every
+call, and `st.plotly_chart` validates plain dicts again. The layouts used by
+this app never change, so they are validated once at import into layout
+templates, and the chart builders assemble plain figure dictionaries from
+those templates plus their data arrays.
+
+Set `PLOTLY_VALIDATE_FIGURES=1` to validate every figure as it is built,
+which is useful when editing a builder or a template.
+"""
+import copy
+import os
+
+import plotly.graph_objects as go
+
+DEBUG_VALIDATION = os.environ.get("PLOTLY_VALIDATE_FIGURES", "").lower() in ("1", "true", "yes")
+
+
+def _validated_layout(**layout):
+    """Return the canonical, fully expanded form of a layout (validates once)"""
+    return go.Figure(layout=layout).to_dict()['layout']
+
+
+def _merge(base, overrides):
+    """Return base with overrides merged in, copying only the changed branches"""
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def title(text):
+    """Return a title in canonical layout form"""
+    return {'text': text}
+
+
+def axis(title_text, **props):
+    """Return an axis in canonical layout form"""
+    return {'title': title(title_text), **props}
+
+
+LAYOUT_TEMPLATES = {
+    'default': _validated_layout(),
+    'comparison_bar': _validated_layout(barmode='group', template='plotly_white'),
+    'radar': _validated_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 10])),
+        showlegend=True
+    ),
+    'performance_surface': _validated_layout(
+        title='Performance Scaling: Quantum vs Classical',
+        scene=dict(
+            xaxis_title='Problem Size',
+            yaxis_title='Problem Complexity',
+            zaxis_title='Computation Time (log scale)',
+            zaxis=dict(type='log')
+        ),
+        width=800,
+        height=800
+    ),
+    'energy_3d': _validated_layout(
+        title='Energy Consumption Across Operation Types',
+        scene=dict(
+            xaxis=dict(
+                title='Computer Type',
+                ticktext=['Classical', 'Quantum'],
+                tickvals=[0, 1],
+                range=[-0.5, 1.5]
+            ),
+            yaxis=dict(
+                title='Operation Complexity',
+                ticktext=['Idle', 'Basic', 'Medium', 'Complex'],
+                tickvals=[0, 1, 2, 3]
+            ),
+            zaxis=dict(title='Energy (Watts)', type='log'),
+        ),
+        width=800,
+        height=800,
+        showlegend=True
+    ),
+    'scaling_animation': _validated_layout(
+        xaxis=dict(title='Problem Size', range=[0, 100]),
+        yaxis=dict(title='Computation Time', type='log'),
+        updatemenus=[dict(
+            type='buttons',
+            showactive=False,
+            buttons=[
+                dict(label='Play',
+                     method='animate',
+                     args=[None, {'frame': {'duration': 50, 'redraw': True},
+                                'fromcurrent': True}]),
+                dict(label='Pause',
+                     method='animate',
+                     args=[[None], {'frame': {'duration': 0, 'redraw': False},
+                                  'mode': 'immediate',
+                                  'transition': {'duration': 0}}])
+            ]
+        )]
+    ),
+}
+
+
+def make_figure(data, template='default', frames=None, **layout):
+    """Assemble a figure dict from traces, a layout template and layout overrides"""
+    # Each figure owns its layout, so editing one (including a cached
+    # figure) can never change the shared templates
+    base = copy.deepcopy(LAYOUT_TEMPLATES[template])
+    fig = {
+        'data': data,
+        'layout': _merge(base, layout) if layout else base
+    }
+    if frames is not None:
+        fig['frames'] = frames
+    if DEBUG_VALIDATION:
+        # Raises ValueError on any invalid property
+        go.Figure(fig)
+    return fig
+
+
+class _PrebuiltFigure(go.Figure):
+    """A go.Figure that hands a prebuilt figure dict to the renderer as-is"""
+
+    def __init__(self, fig_dict):
+        super().__init__(_validate=False)
+        self._fig_dict = fig_dict
+
+    def to_dict(self):
+        return self._fig_dict
+
+    def to_plotly_json(self):
+        return self._fig_dict
+
+
+def chart(fig_dict):
+    """Wrap a figure dict for st.plotly_chart without re-validating it"""
+    if DEBUG_VALIDATION:
+        return go.Figure(fig_dict)
+    return _PrebuiltFigure(fig_dict)
@@ -1,5 +1,7 @@
 import streamlit as st
 from components import comparison, energy, problem_solving
+import profiling
+import warmup
 
 st.set_page_config(
     page_title="Quantum vs Classical Computing",
@@ -7,6 +9,10 @@ st.set_page_config(
     layout="wide"
 )
 
+# Already running when launched with serve.py; under `streamlit run main.py`
+# this starts the warm-up on the first session instead
+warmup.start()
+
 def main():
     st.title("Quantum vs Classical Computing: An Interactive Comparison")
     
@@ -50,5 +56,11 @@ def main():
     - Real-world applications
     """)
 
+    progress = warmup.status()
+    st.sidebar.caption(
+        f"Cache warm-up: {progress['done']}/{progress['total']} items ready"
+        + (f", {progress['failed']} failed" if progress['failed'] else "")
+    )
+
 if __name__ == "__main__":
-    main()
+    profiling.run(main)
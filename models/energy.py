@@ -0,0 +1,69 @@
+"""
+Energy, carbon and cost models behind the Energy Consumption tab.
+
+All functions take scalars or NumPy arrays and broadcast, so a batch job can
+evaluate many hardware baselines, energy mixes and operating schedules in
+one call; the Streamlit view evaluates a single configuration.
+"""
+import numpy as np
+
+from data.computer_data import COMPUTER_COMPARISONS
+
+HOURS_PER_DAY = 24
+
+# Fraction of the idle-to-peak range in use at midday; load rises linearly
+# to peak at midnight (see power_profile)
+BASE_LOAD = {
+    'classical': 0.5,
+    'quantum': 0.3,
+}
+
+# kg CO2 per kWh
+CARBON_FACTORS = {
+    "Coal": 0.995,
+    "Natural Gas": 0.535,
+    "Nuclear": 0.029,
+    "Renewable": 0.005
+}
+
+
+def power_profile(idle, peak, base_load, hours=np.arange(HOURS_PER_DAY)):
+    """Power draw in watts for each hour of the day
+
+    idle, peak and base_load broadcast together; the hour axis is appended
+    last, so scalar inputs give shape (24,).
+    """
+    idle, peak, base_load = (np.asarray(v, dtype=float)[..., None] for v in (idle, peak, base_load))
+    load = base_load + (1 - base_load) * np.abs(12 - np.asarray(hours)) / 12
+    return idle + (peak - idle) * load
+
+
+def baseline_profile(computer):
+    """power_profile() for the 'classical' or 'quantum' baseline in COMPUTER_COMPARISONS"""
+    baseline = COMPUTER_COMPARISONS['energy_baseline'][computer]
+    return power_profile(baseline['idle'], baseline['peak'], BASE_LOAD[computer])
+
+
+def daily_energy(profile, hours):
+    """kWh used running the first `hours` hours of an hourly watt profile"""
+    cumulative = np.cumsum(profile, axis=-1) / 1000
+    index = np.asarray(hours) - 1
+    shape = np.broadcast_shapes(cumulative.shape[:-1], index.shape)
+    cumulative = np.broadcast_to(cumulative, shape + cumulative.shape[-1:])
+    index = np.broadcast_to(index, shape)[..., None]
+    return np.take_along_axis(cumulative, index, axis=-1)[..., 0]
+
+
+def carbon_footprint(energy_kwh, carbon_factor):
+    """kg CO2 for an energy use and a grid carbon intensity (kg CO2/kWh)"""
+    return np.asarray(energy_kwh) * carbon_factor
+
+
+def operating_cost(energy_kwh, electricity_rate):
+    """Cost of an energy use at a $/kWh electricity rate"""
+    return np.asarray(energy_kwh) * electricity_rate
+
+
+def quantum_task_time(classical_time, classical_energy, quantum_energy):
+    """Estimated quantum run time from the classical time and relative task energy"""
+    return np.asarray(classical_time) * np.asarray(classical_energy) / np.asarray(quantum_energy)
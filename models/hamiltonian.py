@@ -0,0 +1,328 @@
+"""
+Sparse Hamiltonian time evolution for the Simulation comparison.
+
+Hamiltonians are lists of (coefficient, Pauli string) terms, e.g.
+(0.5, 'XXI'). Qubit 0 is the leftmost character and the most significant
+bit of a basis-state index. Every Pauli string is a phased permutation of
+basis states, which is used both to assemble the sparse matrix for exact
+classical evolution (Krylov `expm_multiply`) and to apply Trotterized
+circuit evolution term by term, the way a quantum computer would.
+
+Sources:
+- H2 (STO-3G, 0.735 Å, parity mapping with two-qubit reduction):
+  Kandala et al., Nature 549, 242-246 (2017)
+- Trotter-Suzuki product formulas: Childs et al., Phys. Rev. X 11, 011020 (2021)
+"""
+import os
+import time
+import tracemalloc
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import expm_multiply
+
+from data.result_store import host_id
+
+# Small molecules as qubit Hamiltonians of the electronic energy (Hartree),
+# with the nuclear repulsion to add for total energies (1/R for H2 at 0.735 Å)
+MOLECULES = {
+    'H2': {
+        'terms': [
+            (-1.052373245772859, 'II'),
+            (0.39793742484318045, 'IZ'),
+            (-0.39793742484318045, 'ZI'),
+            (-0.01128010425623538, 'ZZ'),
+            (0.18093119978423156, 'XX'),
+        ],
+        'nuclear_repulsion': 0.7199689944258503,
+    }
+}
+
+
+def _pauli_string(n_spins, ops):
+    """Build a Pauli string from a {site: 'X'|'Y'|'Z'} mapping"""
+    chars = ['I'] * n_spins
+    for site, op in ops.items():
+        chars[site] = op
+    return ''.join(chars)
+
+
+def _bonds(n_spins, periodic):
+    bonds = [(i, i + 1) for i in range(n_spins - 1)]
+    if periodic and n_spins > 2:
+        bonds.append((n_spins - 1, 0))
+    return bonds
+
+
+def heisenberg_chain(n_spins, coupling=1.0, field=0.0, periodic=False):
+    """Heisenberg XXX chain: J Σ (XX + YY + ZZ) + h Σ Z"""
+    terms = []
+    for i, j in _bonds(n_spins, periodic):
+        for op in 'XYZ':
+            terms.append((coupling, _pauli_string(n_spins, {i: op, j: op})))
+    if field:
+        terms += [(field, _pauli_string(n_spins, {i: 'Z'})) for i in range(n_spins)]
+    return terms
+
+
+def ising_chain(n_spins, coupling=1.0, field=1.0, periodic=False):
+    """Transverse-field Ising chain: -J Σ ZZ - h Σ X"""
+    terms = [(-coupling, _pauli_string(n_spins, {i: 'Z', j: 'Z'}))
+             for i, j in _bonds(n_spins, periodic)]
+    terms += [(-field, _pauli_string(n_spins, {i: 'X'})) for i in range(n_spins)]
+    return terms
+
+
+SPIN_MODELS = {
+    'Heisenberg chain': heisenberg_chain,
+    'Transverse-field Ising chain': ising_chain,
+}
+
+
+def pauli_action(pauli):
+    """Return (flip_mask, phases) such that P|i> = phases[i] |i ^ flip_mask>"""
+    n_spins = len(pauli)
+    flip_mask = 0
+    sign_mask = 0
+    n_y = 0
+    for site, op in enumerate(pauli):
+        bit = 1 << (n_spins - 1 - site)
+        if op in 'XY':
+            flip_mask |= bit
+        if op in 'YZ':
+            sign_mask |= bit
+        n_y += op == 'Y'
+
+    indices = np.arange(2**n_spins, dtype=np.int64)
+    parity = np.zeros(indices.shape, dtype=np.int64)
+    masked = indices & sign_mask
+    while sign_mask:
+        parity ^= masked & 1
+        masked >>= 1
+        sign_mask >>= 1
+    phases = (1j ** n_y) * (1 - 2 * parity)
+    return flip_mask, phases
+
+
+def to_sparse(terms):
+    """Assemble a list of Pauli terms into a CSR matrix"""
+    n_spins = len(terms[0][1])
+    dim = 2**n_spins
+    cols = np.arange(dim, dtype=np.int64)
+    rows, data = [], []
+    for coeff, pauli in terms:
+        flip_mask, phases = pauli_action(pauli)
+        rows.append(cols ^ flip_mask)
+        data.append(coeff * phases)
+    matrix = sparse.coo_matrix(
+        (np.concatenate(data), (np.concatenate(rows), np.tile(cols, len(terms)))),
+        shape=(dim, dim)
+    ).tocsr()
+    matrix.eliminate_zeros()
+    return matrix
+
+
+def neel_state(n_spins):
+    """Alternating |0101...> product state"""
+    state = np.zeros(2**n_spins, dtype=complex)
+    state[int('01' * (n_spins // 2) + '0' * (n_spins % 2), 2)] = 1.0
+    return state
+
+
+def exact_evolution(hamiltonian, state, t):
+    """exp(-iHt)|state> with a sparse Krylov action (no dense matrix exponential)"""
+    return expm_multiply(-1j * t * hamiltonian, state)
+
+
+def trotter_evolution(terms, state, t, steps, order=2):
+    """Product-formula evolution, applying exp(-i c P dt) for each Pauli term"""
+    actions = [(coeff, *pauli_action(pauli)) for coeff, pauli in terms]
+    indices = np.arange(state.size, dtype=np.int64)
+    dt = t / steps
+    if order == 1:
+        sequence = [(action, dt) for action in actions]
+    elif order == 2:
+        # Symmetric splitting; the adjoining half steps of the last term merge
+        half = [(action, dt / 2) for action in actions[:-1]]
+        sequence = half + [(actions[-1], dt)] + half[::-1]
+    else:
+        raise ValueError(f"Unsupported Trotter order: {order}")
+
+    state = state.astype(complex, copy=True)
+    for _ in range(steps):
+        for (coeff, flip_mask, phases), tau in sequence:
+            angle = coeff * tau
+            pauli_state = np.empty_like(state)
+            pauli_state[indices ^ flip_mask] = phases * state
+            state = np.cos(angle) * state - 1j * np.sin(angle) * pauli_state
+    return state
+
+
+def _measure(fn, *args):
+    """Run fn(*args) and return (result, seconds, peak traced bytes)
+
+    Tracing slows every allocation, so the time comes from an untraced run
+    and the peak memory from a second, traced run.
+    """
+    start = time.perf_counter()
+    result = fn(*args)
+    seconds = time.perf_counter() - start
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    if not was_tracing:
+        tracemalloc.stop()
+    return result, seconds, peak - base
+
+
+def benchmark_evolution(model='Heisenberg chain', sizes=range(4, 15, 2), t=1.0, steps=20, order=2):
+    """Time and measure exact vs Trotterized evolution as the chain grows"""
+    sizes = np.asarray(list(sizes))
+    results = {
+        'sizes': sizes,
+        'nnz': np.zeros(len(sizes), dtype=np.int64),
+        'exact_seconds': np.zeros(len(sizes)),
+        'exact_bytes': np.zeros(len(sizes)),
+        'trotter_seconds': np.zeros(len(sizes)),
+        'trotter_bytes': np.zeros(len(sizes)),
+        'trotter_infidelity': np.zeros(len(sizes)),
+    }
+    for k, n_spins in enumerate(sizes):
+        terms = SPIN_MODELS[model](int(n_spins))
+        state = neel_state(int(n_spins))
+
+        def build_and_evolve():
+            hamiltonian = to_sparse(terms)
+            return hamiltonian.nnz, exact_evolution(hamiltonian, state, t)
+
+        (nnz, exact), results['exact_seconds'][k], results['exact_bytes'][k] = _measure(build_and_evolve)
+        trotter, results['trotter_seconds'][k], results['trotter_bytes'][k] = _measure(
+            trotter_evolution, terms, state, t, steps, order
+        )
+        results['nnz'][k] = nnz
+        results['trotter_infidelity'][k] = 1 - abs(np.vdot(exact, trotter))**2
+    return results
+
+
+def molecule_benchmark(name='H2', t=1.0, steps=(1, 2, 4, 8, 16, 32)):
+    """Trotter error against exact evolution for a molecule in MOLECULES
+
+    Evolves the lowest-energy basis state (the Hartree-Fock state) and
+    returns first- and second-order infidelities for each step count, with
+    the total (electronic plus nuclear repulsion) Hartree-Fock and exact
+    ground-state energies.
+    """
+    molecule = MOLECULES[name]
+    terms = molecule['terms']
+    hamiltonian = to_sparse(terms)
+    diagonal = hamiltonian.diagonal().real
+    state = np.zeros(hamiltonian.shape[0], dtype=complex)
+    state[np.argmin(diagonal)] = 1.0
+    exact = exact_evolution(hamiltonian, state, t)
+
+    steps = np.asarray(steps)
+    results = {'steps': steps}
+    for order in (1, 2):
+        results[f'order{order}_infidelity'] = np.array([
+            1 - abs(np.vdot(exact, trotter_evolution(terms, state, t, int(n), order)))**2
+            for n in steps
+        ])
+    results['hartree_fock_energy'] = float(diagonal.min()) + molecule['nuclear_repulsion']
+    results['ground_energy'] = float(np.linalg.eigvalsh(hamiltonian.toarray())[0]) + molecule['nuclear_repulsion']
+    return results
+
+
+# Result-store layout of benchmark_evolution() output: key -> (backend, metric)
+BENCHMARK_METRICS = {
+    'nnz': ('exact-krylov', 'nnz'),
+    'exact_seconds': ('exact-krylov', 'seconds'),
+    'exact_bytes': ('exact-krylov', 'peak_bytes'),
+    'trotter_seconds': ('trotter', 'seconds'),
+    'trotter_bytes': ('trotter', 'peak_bytes'),
+    'trotter_infidelity': ('trotter', 'infidelity'),
+}
+
+
+# Metrics that depend on the machine and on how they are measured
+MEASURED_METRICS = ('seconds', 'peak_bytes')
+# Bump when the benchmark or its measurement changes, so older runs are not reused
+BENCHMARK_VERSION = 2
+
+
+def _benchmark_params(backend, metric, model, t, steps, order):
+    params = {'model': model, 't': t}
+    if backend == 'trotter':
+        params.update(steps=steps, order=order)
+    if metric in MEASURED_METRICS:
+        params.update(host=host_id(), version=BENCHMARK_VERSION)
+    return params
+
+
+def stored_benchmark_evolution(store, model='Heisenberg chain', sizes=range(4, 15, 2), t=1.0, steps=20, order=2):
+    """benchmark_evolution() backed by a result store; only unseen sizes are run"""
+    sizes = list(sizes)
+    missing = set()
+    for backend, metric in BENCHMARK_METRICS.values():
+        params = _benchmark_params(backend, metric, model, t, steps, order)
+        missing.update(store.missing_sizes('simulation', backend, metric, sizes, params))
+
+    if missing:
+        results = benchmark_evolution(model, sorted(missing), t, steps, order)
+        store.insert_many(
+            {
+                'category': 'simulation',
+                'backend': backend,
+                'params': _benchmark_params(backend, metric, model, t, steps, order),
+                'metric': metric,
+                'problem_size': size,
+                'value': value,
+            }
+            for key, (backend, metric) in BENCHMARK_METRICS.items()
+            for size, value in zip(results['sizes'], results[key])
+        )
+
+    results = {'sizes': np.array(sorted(sizes))}
+    for key, (backend, metric) in BENCHMARK_METRICS.items():
+        params = _benchmark_params(backend, metric, model, t, steps, order)
+        stored_sizes, values = store.curve('simulation', backend, metric, params, min(sizes), max(sizes))
+        results[key] = values[np.isin(stored_sizes, results['sizes'])]
+    return results
+
+
+def available_memory():
+    """Physical memory of this machine in bytes"""
+    return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+
+
+def feasibility_limit(results, memory_bytes=None, time_budget=3600.0):
+    """Extrapolate the largest chain exact classical evolution can handle here
+
+    Fits log2(cost) linearly in the number of spins and returns the sizes at
+    which the exact method would exceed the memory and time budgets.
+    """
+    memory_bytes = memory_bytes or available_memory()
+    sizes = results['sizes']
+
+    # Small sizes are dominated by fixed overhead, so fit the larger half
+    fit = slice(len(sizes) // 2 if len(sizes) >= 4 else 0, None)
+
+    def limit(cost, budget):
+        slope, intercept = np.polyfit(sizes[fit], np.log2(np.maximum(cost[fit], 1e-12)), 1)
+        if slope <= 0:
+            return np.inf
+        return int(np.floor((np.log2(budget) - intercept) / slope))
+
+    memory_limit = limit(results['exact_bytes'], memory_bytes)
+    time_limit = limit(results['exact_seconds'], time_budget)
+    return {
+        'memory_limit_spins': memory_limit,
+        'time_limit_spins': time_limit,
+        'limit_spins': min(memory_limit, time_limit),
+        'memory_bytes': memory_bytes,
+        'time_budget': time_budget,
+    }
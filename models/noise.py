@@ -0,0 +1,182 @@
+"""
+Batched density-matrix simulation of noisy circuits.
+
+A batch of density matrices, one per noise strength, is evolved through the
+same layered circuit. After every layer each qubit goes through depolarizing,
+amplitude-damping and dephasing channels whose Kraus operators carry a batch
+axis, so a whole strength sweep is one einsum per channel and qubit, and the
+fidelity after every layer gives the depth sweep for free.
+
+The fitted decay rate grounds the quantum "Error Rate" and "Scalability"
+scores on the overview radar chart (see radar_scores).
+"""
+import time
+
+import numpy as np
+
+from data.computer_data import COMPUTER_COMPARISONS, HARDWARE_PROFILES
+
+PAULI = {
+    'I': np.eye(2, dtype=complex),
+    'X': np.array([[0, 1], [1, 0]], dtype=complex),
+    'Y': np.array([[0, -1j], [1j, 0]], dtype=complex),
+    'Z': np.array([[1, 0], [0, -1]], dtype=complex),
+}
+
+CNOT = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]], dtype=complex)
+
+
+def depolarizing_kraus(p):
+    """Kraus operators with shape (batch, 4, 2, 2) for depolarizing strengths p"""
+    p = np.asarray(p, dtype=float)[..., None, None]
+    return np.stack([
+        np.sqrt(1 - 3 * p / 4) * PAULI['I'],
+        np.sqrt(p / 4) * PAULI['X'],
+        np.sqrt(p / 4) * PAULI['Y'],
+        np.sqrt(p / 4) * PAULI['Z'],
+    ], axis=-3)
+
+
+def amplitude_damping_kraus(gamma):
+    """Kraus operators with shape (batch, 2, 2, 2) for damping probabilities gamma"""
+    gamma = np.asarray(gamma, dtype=float)
+    k0 = np.zeros(gamma.shape + (2, 2), dtype=complex)
+    k1 = np.zeros_like(k0)
+    k0[..., 0, 0] = 1
+    k0[..., 1, 1] = np.sqrt(1 - gamma)
+    k1[..., 0, 1] = np.sqrt(gamma)
+    return np.stack([k0, k1], axis=-3)
+
+
+def dephasing_kraus(lam):
+    """Phase-damping Kraus operators with shape (batch, 2, 2, 2)"""
+    lam = np.asarray(lam, dtype=float)
+    k0 = np.zeros(lam.shape + (2, 2), dtype=complex)
+    k1 = np.zeros_like(k0)
+    k0[..., 0, 0] = 1
+    k0[..., 1, 1] = np.sqrt(1 - lam)
+    k1[..., 1, 1] = np.sqrt(lam)
+    return np.stack([k0, k1], axis=-3)
+
+
+CHANNELS = {
+    'depolarizing': depolarizing_kraus,
+    'amplitude_damping': amplitude_damping_kraus,
+    'dephasing': dephasing_kraus,
+}
+
+
+def apply_channel(rho, kraus, qubit, n_qubits):
+    """Apply batched single-qubit Kraus operators (batch, k, 2, 2) to rho (batch, d, d)"""
+    batch = rho.shape[0]
+    left, right = 2**qubit, 2**(n_qubits - qubit - 1)
+    rho = rho.reshape(batch, left, 2, right, left, 2, right)
+    rho = np.einsum('bkij,bljrpns,bkmn->blirpms', kraus, rho, kraus.conj(), optimize=True)
+    return rho.reshape(batch, 2**n_qubits, 2**n_qubits)
+
+
+def layer_unitary(angles):
+    """RY(angle) on every qubit followed by a CNOT ladder"""
+    rotation = np.array([[1.0 + 0j]])
+    for angle in angles:
+        c, s = np.cos(angle / 2), np.sin(angle / 2)
+        rotation = np.kron(rotation, np.array([[c, -s], [s, c]], dtype=complex))
+    n_qubits = len(angles)
+    ladder = np.eye(2**n_qubits, dtype=complex)
+    for q in range(n_qubits - 1):
+        ladder = np.kron(np.kron(np.eye(2**q), CNOT), np.eye(2**(n_qubits - q - 2))) @ ladder
+    return ladder @ rotation
+
+
+def simulate_fidelity(n_qubits, depth, strengths, channels=tuple(CHANNELS), seed=0):
+    """Fidelity with the ideal state after each layer, for every noise strength
+
+    strengths is a 1-D array; every selected channel is applied with that
+    strength after each layer on each qubit. Returns shape (len(strengths), depth + 1).
+    """
+    strengths = np.asarray(strengths, dtype=float)
+    dim = 2**n_qubits
+    rng = np.random.default_rng(seed)
+    kraus = [CHANNELS[name](strengths) for name in channels]
+
+    psi = np.zeros(dim, dtype=complex)
+    psi[0] = 1
+    rho = np.zeros((len(strengths), dim, dim), dtype=complex)
+    rho[:, 0, 0] = 1
+
+    fidelity = np.ones((len(strengths), depth + 1))
+    for layer in range(1, depth + 1):
+        unitary = layer_unitary(rng.uniform(0, 2 * np.pi, n_qubits))
+        psi = unitary @ psi
+        rho = unitary @ rho @ unitary.conj().T
+        for ops in kraus:
+            for qubit in range(n_qubits):
+                rho = apply_channel(rho, ops, qubit, n_qubits)
+        fidelity[:, layer] = np.einsum('i,bij,j->b', psi.conj(), rho, psi).real
+    return fidelity
+
+
+def decay_rate(fidelity, n_qubits):
+    """Fitted error rate per qubit-layer from fidelity curves of shape (batch, depth + 1)
+
+    Fidelity relaxes towards 1/d (the maximally mixed state), so the excess
+    over 1/d is fitted as an exponential in depth.
+    """
+    floor = 1 / 2**n_qubits
+    excess = np.clip((fidelity - floor) / (1 - floor), 1e-12, None)
+    layers = np.arange(fidelity.shape[-1])
+    per_layer = -(np.log(excess) @ layers) / (layers @ layers)
+    return per_layer / n_qubits
+
+
+def simulation_cost(qubit_counts, batch=8, depth=5):
+    """Wall-clock seconds per layer and density-matrix bytes for each qubit count"""
+    qubit_counts = np.asarray(qubit_counts)
+    seconds = np.zeros(len(qubit_counts))
+    strengths = np.linspace(1e-3, 1e-2, batch)
+    for i, n_qubits in enumerate(qubit_counts):
+        start = time.perf_counter()
+        simulate_fidelity(int(n_qubits), depth, strengths)
+        seconds[i] = (time.perf_counter() - start) / depth
+    return {
+        'qubits': qubit_counts,
+        'seconds_per_layer': seconds,
+        'bytes': batch * 4.0**qubit_counts * np.dtype(complex).itemsize,
+    }
+
+
+# Reference circuits for the radar scores
+ERROR_RATE_CIRCUIT = {'n_qubits': 4, 'depth': 40}
+# Osprey-sized register, 1000 layers deep
+SCALABILITY_TARGET_VOLUME = COMPUTER_COMPARISONS['processing']['quantum']['qubit_count'] * 1000
+
+# Noise strengths swept for the fidelity-decay chart
+NOISE_SWEEP = (1e-4, 3e-4, 1e-3, 3e-3, 1e-2, 3e-2)
+
+
+def fidelity_sweep(strengths=NOISE_SWEEP):
+    """Fidelity decay of the Error Rate reference circuit across noise strengths"""
+    n_qubits, depth = ERROR_RATE_CIRCUIT['n_qubits'], ERROR_RATE_CIRCUIT['depth']
+    return np.arange(depth + 1), np.asarray(strengths), simulate_fidelity(n_qubits, depth, strengths)
+
+
+def radar_scores(profile='IBM Osprey, 2 μs gates'):
+    """Quantum 'Error Rate' and 'Scalability' scores (0-10) for a hardware profile
+
+    Error Rate is 10x the fidelity of a 4-qubit, 40-layer circuit under all
+    three channels at the profile's error rate. Scalability compares the
+    circuit volume (qubits x layers) that keeps fidelity above 1/2 with an
+    Osprey-sized, 1000-layer target on a log scale.
+    """
+    error_rate = HARDWARE_PROFILES[profile]['error_rate']
+    n_qubits, depth = ERROR_RATE_CIRCUIT['n_qubits'], ERROR_RATE_CIRCUIT['depth']
+    fidelity = simulate_fidelity(n_qubits, depth, [error_rate])
+    rate = decay_rate(fidelity, n_qubits)[0]
+    volume = np.log(2) / rate
+    return {
+        'Error Rate': float(np.clip(10 * fidelity[0, -1], 0, 10)),
+        'Scalability': float(np.clip(10 * np.log(volume) / np.log(SCALABILITY_TARGET_VOLUME), 0, 10)),
+        'error_rate': error_rate,
+        'rate_per_qubit_layer': float(rate),
+        'half_fidelity_volume': float(volume),
+    }
@@ -0,0 +1,193 @@
+"""
+Gate-level resource estimates for the quantum algorithms in problem solving.
+
+Each algorithm is reduced to logical counts (qubits, total gates, T gates
+and sequential depth) as arrays over problem sizes. `estimate()` maps those
+counts onto hardware given gate times and physical error rates, either run
+directly on physical qubits or under a surface code whose distance is chosen
+to keep the whole computation under a target failure probability. Every
+function broadcasts over problem sizes and hardware profiles, so sweeps are a
+handful of array operations.
+
+Sources:
+- Shor: Gidney & Ekerå, Quantum 5, 433 (2021), "How to factor 2048 bit RSA
+  integers in 8 hours using 20 million noisy qubits"
+- Surface code scaling: Fowler et al., Phys. Rev. A 86, 032324 (2012)
+- Rotation synthesis: Ross & Selinger, Quantum Inf. Comput. 16, 901 (2016)
+"""
+import numpy as np
+
+from data.computer_data import HARDWARE_PROFILES
+
+# Clifford+T cost of one Toffoli (standard 7-T decomposition) and its total gate count
+TOFFOLI_T_COUNT = 7
+TOFFOLI_GATES = 15
+
+# T gates per arbitrary rotation at ~1e-10 synthesis error (~3 log2(1/eps))
+ROTATION_T_COUNT = 100
+
+# Physical gate layers per surface-code syndrome cycle
+CYCLE_GATE_LAYERS = 8
+
+# Surface code threshold and prefactor in p_L = A (p / p_th) ** ((d + 1) / 2)
+SURFACE_CODE_THRESHOLD = 1e-2
+SURFACE_CODE_PREFACTOR = 0.1
+
+
+def shor_counts(key_bits):
+    """Factoring an n-bit RSA modulus (Gidney & Ekerå 2021 asymptotics)"""
+    n = np.asarray(key_bits, dtype=float)
+    lg = np.log2(n)
+    toffolis = 0.3 * n**3 + 0.0005 * n**3 * lg
+    return {
+        'logical_qubits': np.ceil(3 * n + 0.002 * n * lg),
+        'gates': toffolis * TOFFOLI_GATES,
+        't_count': toffolis * TOFFOLI_T_COUNT,
+        'depth': 500 * n**2 + n**2 * lg,
+    }
+
+
+def grover_counts(search_qubits):
+    """Unstructured search over 2**n items with a single marked item"""
+    n = np.asarray(search_qubits, dtype=float)
+    iterations = np.floor(np.pi / 4 * 2**(n / 2))
+    # Oracle and diffusion are each an n-controlled Z: 2(n - 2) Toffolis on n - 2 ancillas
+    toffolis = 4 * np.maximum(n - 2, 1)
+    return {
+        'logical_qubits': n + np.maximum(n - 2, 0),
+        'gates': iterations * (toffolis * TOFFOLI_GATES + 6 * n),
+        't_count': iterations * toffolis * TOFFOLI_T_COUNT,
+        'depth': iterations * (toffolis + 4),
+    }
+
+
+def qpe_counts(spins, precision_bits=10, trotter_steps=1):
+    """Phase estimation of a nearest-neighbour Heisenberg chain's energy
+
+    Controlled-U^(2^k) is applied as 2^k repetitions of a Trotterized step;
+    each of the 3(n - 1) Pauli terms costs two rotations and four CNOTs when
+    controlled on the phase register.
+    """
+    n = np.asarray(spins, dtype=float)
+    applications = (2**precision_bits - 1) * trotter_steps
+    rotations = applications * 2 * 3 * (n - 1)
+    return {
+        'logical_qubits': n + precision_bits,
+        'gates': rotations + applications * 4 * 3 * (n - 1) + precision_bits**2,
+        't_count': rotations * ROTATION_T_COUNT,
+        'depth': rotations + precision_bits**2,
+    }
+
+
+def annealing_counts(variables, layers=10):
+    """Gate-model counterpart of quantum annealing: QAOA on a dense QUBO
+
+    Each layer applies a ZZ rotation per variable pair (two CNOTs and one
+    rotation) and an X rotation per variable; an edge colouring of the
+    complete graph runs the pairs in n - 1 rounds.
+    """
+    n = np.asarray(variables, dtype=float)
+    pairs = n * (n - 1) / 2
+    rotations = layers * (pairs + n)
+    return {
+        'logical_qubits': n,
+        'gates': rotations + layers * 2 * pairs + n,
+        't_count': rotations * ROTATION_T_COUNT,
+        'depth': layers * (3 * np.maximum(n - 1, 1) + 1),
+    }
+
+
+# Keyed by the algorithm categories used in problem solving
+ALGORITHMS = {
+    "Factorization": {
+        'name': "Shor's Algorithm",
+        'counts': shor_counts,
+        'size_label': 'RSA Key Size (bits)',
+        'sizes': np.arange(256, 4097, 256)
+    },
+    "Search": {
+        'name': "Grover's Algorithm",
+        'counts': grover_counts,
+        'size_label': 'Search Space (qubits, 2^n items)',
+        'sizes': np.arange(4, 65, 4)
+    },
+    "Optimization": {
+        'name': "Quantum Annealing (as QAOA)",
+        'counts': annealing_counts,
+        'size_label': 'Problem Variables',
+        'sizes': np.arange(10, 1001, 50)
+    },
+    "Simulation": {
+        'name': "Quantum Phase Estimation",
+        'counts': qpe_counts,
+        'size_label': 'System Size (spins)',
+        'sizes': np.arange(4, 205, 10)
+    }
+}
+
+
+def code_distance(error_rate, volume, target_error=0.01):
+    """Smallest odd surface-code distance keeping volume * p_L under target_error
+
+    Returns inf where the physical error rate is at or above threshold.
+    """
+    ratio = np.asarray(error_rate, dtype=float) / SURFACE_CODE_THRESHOLD
+    with np.errstate(divide='ignore', invalid='ignore'):
+        exponent = np.log(target_error / (SURFACE_CODE_PREFACTOR * np.asarray(volume))) / np.log(ratio)
+    distance = np.maximum(np.ceil(2 * exponent - 1), 3)
+    distance += (distance % 2 == 0)
+    return np.where(ratio < 1, distance, np.inf)
+
+
+def estimate(counts, gate_time, error_rate, error_correction=True,
+             target_error=0.01, routing_overhead=2.0):
+    """Map logical counts onto hardware
+
+    counts arrays have shape (sizes,); gate_time and error_rate may have shape
+    (profiles,) and results broadcast to (profiles, sizes). Without error
+    correction every logical layer takes one gate time and the success
+    probability decays with the gate count. With a surface code each logical
+    layer takes d syndrome cycles and each logical qubit uses 2 d^2 physical
+    qubits, scaled by routing_overhead for lattice surgery and distillation.
+    """
+    gate_time = np.asarray(gate_time, dtype=float)[..., None]
+    error_rate = np.asarray(error_rate, dtype=float)[..., None]
+    qubits = counts['logical_qubits']
+    depth = counts['depth']
+
+    if not error_correction:
+        return {
+            'seconds': depth * gate_time,
+            'physical_qubits': np.broadcast_to(qubits, np.broadcast_shapes(qubits.shape, gate_time.shape)),
+            'success_probability': np.exp(counts['gates'] * np.log1p(-error_rate)),
+        }
+
+    distance = code_distance(error_rate, qubits * depth, target_error)
+    cycle_time = CYCLE_GATE_LAYERS * gate_time
+    return {
+        'seconds': depth * distance * cycle_time,
+        'physical_qubits': qubits * 2 * distance**2 * routing_overhead,
+        'code_distance': distance,
+    }
+
+
+def estimate_profiles(algorithm_type, sizes=None, profiles=None, **options):
+    """Estimate an algorithm across problem sizes for every hardware profile"""
+    algorithm = ALGORITHMS[algorithm_type]
+    sizes = algorithm['sizes'] if sizes is None else np.asarray(sizes)
+    profiles = profiles or HARDWARE_PROFILES
+    counts = algorithm['counts'](sizes)
+    result = estimate(
+        counts,
+        [p['gate_time'] for p in profiles.values()],
+        [p['error_rate'] for p in profiles.values()],
+        **options
+    )
+    device_qubits = np.array([p['qubit_count'] for p in profiles.values()])[:, None]
+    result.update(
+        sizes=sizes,
+        profiles=list(profiles),
+        counts=counts,
+        fits_device=result['physical_qubits'] <= device_qubits
+    )
+    return result
@@ -0,0 +1,66 @@
+"""
+Idealised classical vs quantum scaling curves used by the charts.
+
+Every function is elementwise over NumPy arrays of problem sizes (and
+complexities for the surface), so any grid of parameters can be evaluated
+in one call without building a figure.
+"""
+import numpy as np
+
+# Resources required by each algorithm category in problem solving
+ALGORITHM_SCALING = {
+    "Factorization": {
+        "classical": lambda n: np.exp(np.sqrt(n)),
+        "quantum": lambda n: np.log(n)**2
+    },
+    "Search": {
+        "classical": lambda n: n,
+        "quantum": lambda n: np.sqrt(n)
+    },
+    "Optimization": {
+        "classical": lambda n: 2**np.sqrt(n),
+        "quantum": lambda n: n**2
+    },
+    "Simulation": {
+        "classical": lambda n: 2**n,
+        "quantum": lambda n: n**3
+    }
+}
+
+# Computation time shown by the scaling animation
+ANIMATION_SCALING = {
+    "Search": {
+        "classical": lambda n: n,  # O(n)
+        "quantum": lambda n: np.sqrt(n)  # O(√n)
+    },
+    "Factoring": {
+        "classical": lambda n: np.exp(np.sqrt(n)),  # Exponential
+        "quantum": lambda n: np.log2(n)**2  # Polynomial
+    }
+}
+
+
+def algorithm_scaling(problem_size):
+    """Return {category: {'classical': array, 'quantum': array}} for the given sizes"""
+    problem_size = np.asarray(problem_size, dtype=float)
+    return {
+        category: {kind: fn(problem_size) for kind, fn in curves.items()}
+        for category, curves in ALGORITHM_SCALING.items()
+    }
+
+
+def compute_algorithm_scaling(max_size=100, points=100):
+    """Resource curves for each algorithm category on the problem-solving grid"""
+    problem_size = np.linspace(1, max_size, points)
+    return problem_size, algorithm_scaling(problem_size)
+
+
+def performance_surface(problem_size, problem_complexity, max_size=50, max_complexity=50):
+    """Return (classical_time, quantum_time) for broadcastable size and complexity arrays"""
+    # Classical computation time (exponential with both size and complexity)
+    classical_time = np.exp(problem_size/max_size + problem_complexity/max_complexity)
+
+    # Quantum computation time (polynomial with size, logarithmic with complexity)
+    quantum_time = (problem_size/5)**2 * np.log2(problem_complexity + 1)
+
+    return classical_time, quantum_time
@@ -0,0 +1,449 @@
+"""
+Multi-core statevector simulation in shared memory, for QFT and phase estimation.
+
+The amplitude array lives in a multiprocessing shared-memory block that every
+worker process maps. It is partitioned by qubit index: the top k qubits (the
+most significant index bits) select one of 2**k contiguous chunks, and the
+remaining "local" qubits address amplitudes within a chunk. A run of gates
+touching only local qubits is applied by each worker to its own chunks
+without any synchronisation; a gate on a partition qubit is split across
+workers along another qubit axis instead, one barrier per gate.
+
+Qubit q is bit q of the basis-state index (qubit 0 is least significant).
+Circuits are lists of ('u', target, matrix) and ('cu', control, target,
+matrix) operations with 2x2 matrices. fuse_gates() merges consecutive
+single-qubit gates on the same qubit, then merges runs of diagonal gates
+(phases and controlled phases, which commute) into ('d', qubits, table)
+operations, so each run costs one memory pass.
+
+Run `python -m models.statevector` to check the engine against np.fft and
+exact phase estimation for 1 to 4 workers.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+
+# Largest qubit set merged into one diagonal pass (its phase table has 2**k entries)
+FUSED_DIAGONAL_QUBITS = 10
+
+H = np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2)
+X = np.array([[0, 1], [1, 0]], dtype=complex)
+
+
+def phase(theta):
+    """Phase gate diag(1, e^(i theta))"""
+    return np.array([[1, 0], [0, np.exp(1j * theta)]], dtype=complex)
+
+
+def _qubits(op):
+    return op[1] if op[0] == 'd' else op[1:-1]
+
+
+def _is_diagonal(op):
+    return op[0] == 'd' or (op[-1][0, 1] == 0 and op[-1][1, 0] == 0)
+
+
+def _diagonal_layout(qubits, n_bits):
+    """Reshape dims and phase-table shape for a diagonal on qubits (descending)
+
+    Adjacent qubits share one axis, so a run of low qubits stays a single
+    contiguous inner dimension.
+    """
+    runs = []
+    for q in qubits:
+        if runs and runs[-1][-1] == q + 1:
+            runs[-1].append(q)
+        else:
+            runs.append([q])
+    dims, shape = [], []
+    above = n_bits
+    for run in runs:
+        dims += [2**(above - 1 - run[0]), 2**len(run)]
+        shape += [1, 2**len(run)]
+        above = run[-1]
+    return dims + [2**above], shape + [1]
+
+
+def _axes(op, n_bits):
+    """Reshape dims (most significant first) and the axes of the control and target bits"""
+    if op[0] == 'u':
+        target = op[1]
+        return (2**(n_bits - 1 - target), 2, 2**target), None, 1
+    control, target = op[1], op[2]
+    hi, lo = max(control, target), min(control, target)
+    dims = (2**(n_bits - 1 - hi), 2, 2**(hi - lo - 1), 2, 2**lo)
+    return dims, (1 if control == hi else 3), (1 if target == hi else 3)
+
+
+def apply_gate(amplitudes, n_bits, op, axis=None, start=None, stop=None):
+    """Apply one operation in place, optionally to a slice [start, stop) of a free axis"""
+    if op[0] == 'd':
+        dims, shape = _diagonal_layout(op[1], n_bits)
+        view = amplitudes.reshape(dims)
+        index = [slice(None)] * len(dims)
+        if axis is not None:
+            index[axis] = slice(start, stop)
+        view[tuple(index)] *= op[2].reshape(shape)
+        return
+
+    matrix = op[-1]
+    dims, control_axis, target_axis = _axes(op, n_bits)
+    view = amplitudes.reshape(dims)
+    index = [slice(None)] * len(dims)
+    if axis is not None:
+        index[axis] = slice(start, stop)
+    if control_axis is not None:
+        index[control_axis] = 1
+
+    index[target_axis] = 0
+    a0 = view[tuple(index)]
+    index[target_axis] = 1
+    a1 = view[tuple(index)]
+
+    if matrix[0, 1] == 0 and matrix[1, 0] == 0:
+        # Diagonal gates (phases) touch each amplitude once and skip identities
+        if matrix[0, 0] != 1:
+            a0 *= matrix[0, 0]
+        if matrix[1, 1] != 1:
+            a1 *= matrix[1, 1]
+        return
+    new0 = matrix[0, 0] * a0 + matrix[0, 1] * a1
+    a1 *= matrix[1, 1]
+    a1 += matrix[1, 0] * a0
+    a0[...] = new0
+
+
+def _diagonal_table(ops, qubits):
+    """Combined phase table, one axis per qubit (descending), of commuting diagonal gates"""
+    table = np.ones((2,) * len(qubits), dtype=complex)
+    axes = {q: a for a, q in enumerate(qubits)}
+    for op in ops:
+        diagonal = np.diag(op[-1])
+        shape = [1] * len(qubits)
+        if op[0] == 'u':
+            shape[axes[op[1]]] = 2
+            table *= diagonal.reshape(shape)
+            continue
+        control, target = op[1], op[2]
+        # Rows index the control bit, columns the target bit
+        factor = np.ones((2, 2), dtype=complex)
+        factor[1] = diagonal
+        if axes[control] > axes[target]:
+            factor = factor.T
+        shape[axes[control]] = shape[axes[target]] = 2
+        table *= factor.reshape(shape)
+    return table
+
+
+def fuse_gates(circuit):
+    """Merge single-qubit gates per qubit, then runs of diagonal gates into one pass each"""
+    singles = []
+    pending = {}
+
+    def flush(qubit):
+        if qubit in pending:
+            singles.append(('u', qubit, pending.pop(qubit)))
+
+    for op in circuit:
+        if op[0] == 'u':
+            pending[op[1]] = op[2] @ pending.get(op[1], np.eye(2, dtype=complex))
+        else:
+            flush(op[1])
+            flush(op[2])
+            singles.append(op)
+    for qubit in list(pending):
+        flush(qubit)
+
+    fused = []
+    group, group_qubits = [], set()
+
+    def flush_group():
+        if len(group) == 1:
+            fused.append(group[0])
+        elif group:
+            qubits = tuple(sorted(group_qubits, reverse=True))
+            fused.append(('d', qubits, _diagonal_table(group, qubits)))
+        group.clear()
+        group_qubits.clear()
+
+    for op in singles:
+        qubits = set(_qubits(op))
+        if _is_diagonal(op):
+            if len(group_qubits | qubits) > FUSED_DIAGONAL_QUBITS:
+                flush_group()
+            group.append(op)
+            group_qubits |= qubits
+        elif qubits.isdisjoint(group_qubits):
+            # Commutes with the open diagonal run, so it can be applied first
+            fused.append(op)
+        else:
+            flush_group()
+            fused.append(op)
+    flush_group()
+    return fused
+
+
+def qft_circuit(qubits, swaps=True, inverse=False):
+    """Quantum Fourier transform on the given qubits (least significant first)"""
+    qubits = list(qubits)
+    n = len(qubits)
+    circuit = []
+    for i in reversed(range(n)):
+        circuit.append(('u', qubits[i], H))
+        for j in reversed(range(i)):
+            circuit.append(('cu', qubits[j], qubits[i], phase(np.pi / 2**(i - j))))
+    if swaps:
+        for i in range(n // 2):
+            a, b = qubits[i], qubits[n - 1 - i]
+            circuit += [('cu', a, b, X), ('cu', b, a, X), ('cu', a, b, X)]
+    if inverse:
+        circuit = [op[:-1] + (op[-1].conj().T,) for op in reversed(circuit)]
+    return circuit
+
+
+def qpe_circuit(counting_qubits, eigenphase):
+    """Phase estimation of U = diag(1, e^(2 pi i phi)) on its |1> eigenstate
+
+    Counting qubits are 0..m-1 and the eigenstate qubit is m; the caller
+    prepares the eigenstate (basis index 2**m).
+    """
+    m = counting_qubits
+    circuit = [('u', q, H) for q in range(m)]
+    circuit += [('cu', q, m, phase(2 * np.pi * eigenphase * 2**q)) for q in range(m)]
+    return circuit + qft_circuit(range(m), inverse=True)
+
+
+# Worker process state: the shared amplitude array mapped into this process
+_worker = {}
+
+# tmpfs backing POSIX shared memory on Linux; often only 64 MiB in containers
+SHARED_MEMORY_DIR = '/dev/shm'
+
+
+def _check_shared_memory(size):
+    """Raise MemoryError if a shared block of size bytes would not fit
+
+    Writing past a full tmpfs kills the process with SIGBUS instead of
+    failing the allocation, so the space is checked up front.
+    """
+    if not os.path.isdir(SHARED_MEMORY_DIR):
+        return
+    stats = os.statvfs(SHARED_MEMORY_DIR)
+    free = stats.f_bavail * stats.f_frsize
+    if size > free:
+        raise MemoryError(
+            f"A {size / 2**20:.0f} MiB statevector does not fit in {SHARED_MEMORY_DIR} "
+            f"({free / 2**20:.0f} MiB free); use fewer qubits or a single worker"
+        )
+
+
+def _attach(name, n_qubits):
+    block = shared_memory.SharedMemory(name=name)
+    _worker['block'] = block
+    _worker['state'] = np.ndarray(2**n_qubits, dtype=complex, buffer=block.buf)
+    _worker['n_qubits'] = n_qubits
+
+
+def _ready():
+    return os.getpid()
+
+
+def _run_local(chunks, chunk_bits, ops):
+    state = _worker['state']
+    size = 2**chunk_bits
+    for chunk in chunks:
+        amplitudes = state[chunk * size:(chunk + 1) * size]
+        for op in ops:
+            apply_gate(amplitudes, chunk_bits, op)
+
+
+def _run_global(op, axis, start, stop):
+    apply_gate(_worker['state'], _worker['n_qubits'], op, axis, start, stop)
+
+
+class SharedStatevector:
+    """A statevector updated by a pool of worker processes through shared memory
+
+    With a single worker the state is an ordinary array and no pool is started.
+    Raises MemoryError if the shared block would not fit in /dev/shm.
+    """
+
+    def __init__(self, n_qubits, workers=None):
+        self.n_qubits = n_qubits
+        self.workers = max(1, min(workers or os.cpu_count() or 1, 2**(n_qubits - 1)))
+        # Enough chunks to give every worker at least one
+        self.partition_bits = int(np.ceil(np.log2(self.workers))) if self.workers > 1 else 0
+        self.chunk_bits = n_qubits - self.partition_bits
+        self._block = None
+        self._pool = None
+        if self.workers == 1:
+            # No worker processes to share with, so keep the state in ordinary memory
+            self.state = np.zeros(2**n_qubits, dtype=complex)
+        else:
+            size = 2**n_qubits * np.dtype(complex).itemsize
+            _check_shared_memory(size)
+            self._block = shared_memory.SharedMemory(create=True, size=size)
+            self.state = np.ndarray(2**n_qubits, dtype=complex, buffer=self._block.buf)
+        self.reset()
+        if self.workers > 1:
+            try:
+                # spawn rather than fork: the Streamlit server process is multi-threaded
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=get_context('spawn'),
+                    initializer=_attach,
+                    initargs=(self._block.name, n_qubits)
+                )
+                # Start the workers now so process start-up is not timed as simulation
+                for future in [self._pool.submit(_ready) for _ in range(self.workers)]:
+                    future.result()
+            except BaseException:
+                # Release the shared memory block, which would otherwise outlive us
+                self.close()
+                raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self.state = None
+        if self._block is not None:
+            self._block.close()
+            self._block.unlink()
+            self._block = None
+
+    def reset(self, basis_index=0):
+        self.state[:] = 0
+        self.state[basis_index] = 1
+
+    def _is_local(self, op):
+        return all(q < self.chunk_bits for q in _qubits(op))
+
+    def _segments(self, circuit):
+        """Group the circuit into runs of local gates and single global gates"""
+        run = []
+        for op in circuit:
+            if self._is_local(op):
+                run.append(op)
+                continue
+            if run:
+                yield 'local', run
+                run = []
+            yield 'global', op
+        if run:
+            yield 'local', run
+
+    def _apply_global(self, op):
+        if op[0] == 'd':
+            dims, shape = _diagonal_layout(op[1], self.n_qubits)
+            free = [a for a in range(len(dims)) if shape[a] == 1]
+        else:
+            dims, control_axis, target_axis = _axes(op, self.n_qubits)
+            free = [a for a in range(len(dims)) if a not in (control_axis, target_axis)]
+        axis = max(free, key=lambda a: dims[a])
+        bounds = np.linspace(0, dims[axis], min(self.workers, dims[axis]) + 1).astype(int)
+        futures = [self._pool.submit(_run_global, op, axis, start, stop)
+                   for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+        for future in futures:
+            future.result()
+
+    def run(self, circuit, fuse=True):
+        """Apply a circuit; returns gate, pass and synchronisation counts and timing"""
+        ops = fuse_gates(circuit) if fuse else list(circuit)
+        start = time.perf_counter()
+        syncs = 0
+        if self._pool is None:
+            for op in ops:
+                apply_gate(self.state, self.n_qubits, op)
+        else:
+            chunks = np.array_split(np.arange(2**self.partition_bits), self.workers)
+            for kind, segment in self._segments(ops):
+                syncs += 1
+                if kind == 'global':
+                    self._apply_global(segment)
+                    continue
+                futures = [self._pool.submit(_run_local, part.tolist(), self.chunk_bits, segment)
+                           for part in chunks]
+                for future in futures:
+                    future.result()
+        seconds = time.perf_counter() - start
+        return {
+            'gates': len(circuit),
+            'passes': len(ops),
+            'syncs': syncs,
+            'seconds': seconds,
+            'amplitude_updates_per_second': len(ops) * 2**self.n_qubits / seconds,
+        }
+
+
+def estimate_phase(counting_qubits, eigenphase, workers=None):
+    """Run phase estimation and return the estimated phase with run statistics"""
+    n_qubits = counting_qubits + 1
+    with SharedStatevector(n_qubits, workers) as sv:
+        sv.reset(2**counting_qubits)
+        stats = sv.run(qpe_circuit(counting_qubits, eigenphase))
+        probabilities = np.abs(sv.state[2**counting_qubits:])**2
+    stats['estimate'] = int(np.argmax(probabilities)) / 2**counting_qubits
+    stats['probability'] = float(probabilities.max())
+    return stats
+
+
+def throughput_scaling(n_qubits, worker_counts=None, fuse=True):
+    """QFT throughput on n_qubits for each worker count (1 = single-process NumPy)"""
+    if worker_counts is None:
+        cores = os.cpu_count() or 1
+        worker_counts = [w for w in (1, 2, 4, 8, 16, 32, 64) if w <= cores]
+    circuit = qft_circuit(range(n_qubits))
+    # A layer of Hadamards first gives the QFT a dense input
+    circuit = [('u', q, H) for q in range(n_qubits)] + circuit
+    results = {'workers': np.asarray(worker_counts), 'seconds': [], 'amplitude_updates_per_second': []}
+    for workers in worker_counts:
+        with SharedStatevector(n_qubits, workers) as sv:
+            stats = sv.run(circuit, fuse=fuse)
+        results['seconds'].append(stats['seconds'])
+        results['amplitude_updates_per_second'].append(stats['amplitude_updates_per_second'])
+    results['seconds'] = np.array(results['seconds'])
+    results['amplitude_updates_per_second'] = np.array(results['amplitude_updates_per_second'])
+    results['speedup'] = results['seconds'][0] / results['seconds']
+    return results
+
+
+def check(n_qubits=10, worker_counts=(1, 2, 3, 4), seed=0):
+    """Maximum errors against np.fft (QFT) and exact phase estimation for each worker count"""
+    rng = np.random.default_rng(seed)
+    amplitudes = rng.normal(size=2**n_qubits) + 1j * rng.normal(size=2**n_qubits)
+    amplitudes /= np.linalg.norm(amplitudes)
+    # With qubit 0 least significant, this QFT is the unitary inverse DFT
+    expected = np.fft.ifft(amplitudes, norm='ortho')
+    counting_qubits = n_qubits - 1
+    # Exact QPE output: the DFT of the phases kicked back onto the counting register
+    eigenphase = 1 / 3
+    kicked_back = np.exp(2j * np.pi * eigenphase * np.arange(2**counting_qubits))
+    expected_qpe = np.fft.fft(kicked_back) / 2**counting_qubits
+    errors = {}
+    for workers in worker_counts:
+        for fuse in (True, False):
+            with SharedStatevector(n_qubits, workers) as sv:
+                sv.state[:] = amplitudes
+                sv.run(qft_circuit(range(n_qubits)), fuse=fuse)
+                qft_error = float(np.abs(sv.state - expected).max())
+                sv.reset(2**counting_qubits)
+                sv.run(qpe_circuit(counting_qubits, eigenphase), fuse=fuse)
+                qpe_error = float(np.abs(sv.state[2**counting_qubits:] - expected_qpe).max())
+            errors[workers, fuse] = {'qft': qft_error, 'qpe': qpe_error}
+    return errors
+
+
+if __name__ == "__main__":
+    for (workers, fuse), error in check().items():
+        status = 'ok' if max(error.values()) < 1e-10 else 'FAILED'
+        print(f"workers={workers} fuse={fuse}: QFT {error['qft']:.1e}, QPE {error['qpe']:.1e} {status}")
@@ -0,0 +1,104 @@
+"""
+Opt-in profiling of a single page rerun.
+
+Add `?profile=1` to the app URL to profile the next rerun, or set
+PROFILE_RERUNS=1 in the server environment to profile every rerun. Each
+profiled rerun writes two files to $PROFILE_DIR (default: profiles/ in the
+project root):
+
+- <timestamp>-<pid>-<n>.prof: cProfile stats; open with `snakeviz` or `tuna` for an
+  icicle/flame view, or with pstats
+- <timestamp>-<pid>-<n>.txt: call tree of the app's render functions, chart builders
+  and Plotly serialization, sorted by cumulative time
+
+Only one rerun is profiled at a time (Python allows one active profiler);
+reruns that overlap a profiled one, or start while another profiling tool
+is attached, run unprofiled. When neither switch is set, run() calls main
+directly.
+"""
+import cProfile
+import io
+import itertools
+import os
+import pstats
+import sys
+import threading
+import time
+
+import streamlit as st
+
+PROFILE_DIR = os.environ.get(
+    'PROFILE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'profiles')
+)
+PROFILE_EVERY_RERUN = os.environ.get('PROFILE_RERUNS', '').lower() in ('1', 'true', 'yes')
+
+# Functions reported in the call tree: page render functions, chart
+# builders, figure assembly and Plotly/Streamlit chart serialization
+REPORT_PATTERNS = [
+    r'components[/\\].*render_',
+    r'utils\.py.*create_',
+    r'figures\.py',
+    r'warmup\.py.*fetch',
+    r'models[/\\]',
+    r'plotly[/\\]io[/\\]_json\.py.*to_json',
+    r'streamlit[/\\]elements[/\\]plotly_chart\.py.*plotly_chart',
+]
+
+
+_profile_lock = threading.Lock()
+# Distinguishes captures written within the same second
+_capture_ids = itertools.count(1)
+
+
+def _other_profiler_active():
+    if sys.version_info >= (3, 12):
+        return sys.monitoring.get_tool(sys.monitoring.PROFILER_ID) is not None
+    return sys.getprofile() is not None
+
+
+def _requested():
+    if PROFILE_EVERY_RERUN:
+        return True
+    if st.query_params.get('profile') in ('1', 'true'):
+        # Profile this rerun only
+        del st.query_params['profile']
+        return True
+    return False
+
+
+def _write_report(profiler, path):
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream).sort_stats('cumulative')
+    stream.write(f"Profiled rerun: {path}.prof\n\n")
+    for pattern in REPORT_PATTERNS:
+        stats.print_stats(pattern, 15)
+    stream.write("\n==== Call tree from page render functions ====\n")
+    stats.print_callees(REPORT_PATTERNS[0])
+    with open(path + '.txt', 'w') as f:
+        f.write(stream.getvalue())
+
+
+def run(main):
+    """Call main(), profiling it when requested"""
+    if not _requested():
+        return main()
+    if not _profile_lock.acquire(blocking=False):
+        st.sidebar.caption("Another rerun is being profiled; this one was not")
+        return main()
+
+    try:
+        if _other_profiler_active():
+            st.sidebar.caption("Another profiler is active; this rerun was not profiled")
+            return main()
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(main)
+        finally:
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            name = time.strftime('%Y%m%d-%H%M%S') + f'-{os.getpid()}-{next(_capture_ids)}'
+            path = os.path.join(PROFILE_DIR, name)
+            profiler.dump_stats(path + '.prof')
+            _write_report(profiler, path)
+            st.sidebar.caption(f"Profile written to {path}.prof")
+    finally:
+        _profile_lock.release()
@@ -0,0 +1,23 @@
+"""
+Launch the app with cache warm-up starting at server start.
+
+`streamlit run main.py` only executes the page script, and with it
+warmup.start(), when the first session connects, so the first visitor after
+a deploy still waits for the expensive figures. This launcher starts the
+warm-up pool in the server process before Streamlit begins serving; the page
+script then finds the pool already running.
+
+Usage: python serve.py [streamlit run options, e.g. --server.port 8501]
+"""
+import os
+import sys
+
+from streamlit.web import cli as stcli
+
+import warmup
+
+if __name__ == "__main__":
+    warmup.start()
+    main_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+    sys.argv = ["streamlit", "run", main_script, *sys.argv[1:]]
+    sys.exit(stcli.main())
@@ -1,63 +1,65 @@
+import json
 import numpy as np
-import plotly.graph_objects as go
 import plotly.express as px
+from figures import make_figure, axis, title as figure_title
+from models.scaling import ANIMATION_SCALING, performance_surface
+
+# Named colorscales resolved once, as Plotly validation would expand them
+SURFACE_COLORSCALES = {
+    name: [[i / (len(colors) - 1), color] for i, color in enumerate(colors)]
+    for name, colors in (
+        ('Blues', px.colors.sequential.Blues),
+        ('Oranges', px.colors.sequential.Oranges),
+    )
+}
 
 def create_comparison_chart(data, title, x_label, y_label):
     """Create a comparative bar chart using Plotly"""
-    fig = go.Figure()
-
-    fig.add_trace(go.Bar(
-        x=data['categories'],
-        y=data['classical'],
-        name='Classical Computer',
-        marker_color='#1f77b4'
-    ))
-
-    fig.add_trace(go.Bar(
-        x=data['categories'],
-        y=data['quantum'],
-        name='Quantum Computer',
-        marker_color='#ff7f0e'
-    ))
-
-    fig.update_layout(
-        title=title,
-        xaxis_title=x_label,
-        yaxis_title=y_label,
-        barmode='group',
-        template='plotly_white'
+    traces = [
+        {
+            'type': 'bar',
+            'x': data['categories'],
+            'y': data['classical'],
+            'name': 'Classical Computer',
+            'marker': {'color': '#1f77b4'}
+        },
+        {
+            'type': 'bar',
+            'x': data['categories'],
+            'y': data['quantum'],
+            'name': 'Quantum Computer',
+            'marker': {'color': '#ff7f0e'}
+        }
+    ]
+
+    return make_figure(
+        traces,
+        template='comparison_bar',
+        title=figure_title(title),
+        xaxis=axis(x_label),
+        yaxis=axis(y_label)
     )
 
-    return fig
-
 def create_radar_chart(categories, classical_values, quantum_values):
     """Create a radar chart comparing classical and quantum computers"""
-    fig = go.Figure()
-
-    fig.add_trace(go.Scatterpolar(
-        r=classical_values,
-        theta=categories,
-        fill='toself',
-        name='Classical Computer'
-    ))
-
-    fig.add_trace(go.Scatterpolar(
-        r=quantum_values,
-        theta=categories,
-        fill='toself',
-        name='Quantum Computer'
-    ))
-
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 10]
-            )),
-        showlegend=True
-    )
+    traces = [
+        {
+            'type': 'scatterpolar',
+            'r': classical_values,
+            'theta': categories,
+            'fill': 'toself',
+            'name': 'Classical Computer'
+        },
+        {
+            'type': 'scatterpolar',
+            'r': quantum_values,
+            'theta': categories,
+            'fill': 'toself',
+            'name': 'Quantum Computer'
+        }
+    ]
 
-    return fig
+    return make_figure(traces, template='radar')
 
 def create_3d_performance_surface(max_size=50, max_complexity=50):
     """Create a 3D surface plot comparing performance scaling"""
@@ -65,55 +67,41 @@ def create_3d_performance_surface(max_size=50, max_complexity=50):
     problem_complexity = np.linspace(1, max_complexity, 50)
     size_grid, complexity_grid = np.meshgrid(problem_size, problem_complexity)
 
-    # Classical computation time (exponential with both size and complexity)
-    classical_time = np.exp(size_grid/max_size + complexity_grid/max_complexity)
-
-    # Quantum computation time (polynomial with size, logarithmic with complexity)
-    quantum_time = (size_grid/5)**2 * np.log2(complexity_grid + 1)
-
-    fig = go.Figure()
-
-    # Classical surface
-    fig.add_trace(go.Surface(
-        x=size_grid,
-        y=complexity_grid,
-        z=classical_time,
-        name='Classical',
-        colorscale='Blues',
-        showscale=False,
-        opacity=0.8
-    ))
-
-    # Quantum surface
-    fig.add_trace(go.Surface(
-        x=size_grid,
-        y=complexity_grid,
-        z=quantum_time,
-        name='Quantum',
-        colorscale='Oranges',
-        showscale=False,
-        opacity=0.8
-    ))
-
-    fig.update_layout(
-        title='Performance Scaling: Quantum vs Classical',
-        scene=dict(
-            xaxis_title='Problem Size',
-            yaxis_title='Problem Complexity',
-            zaxis_title='Computation Time (log scale)',
-            zaxis=dict(type='log')
-        ),
-        width=800,
-        height=800
+    classical_time, quantum_time = performance_surface(
+        size_grid, complexity_grid, max_size, max_complexity
     )
 
-    return fig
+    traces = [
+        # Classical surface
+        {
+            'type': 'surface',
+            'x': size_grid,
+            'y': complexity_grid,
+            'z': classical_time,
+            'name': 'Classical',
+            'colorscale': SURFACE_COLORSCALES['Blues'],
+            'showscale': False,
+            'opacity': 0.8
+        },
+        # Quantum surface
+        {
+            'type': 'surface',
+            'x': size_grid,
+            'y': complexity_grid,
+            'z': quantum_time,
+            'name': 'Quantum',
+            'colorscale': SURFACE_COLORSCALES['Oranges'],
+            'showscale': False,
+            'opacity': 0.8
+        }
+    ]
+
+    return make_figure(traces, template='performance_surface')
 
 def create_energy_3d_bars():
     """Create a 3D visualization comparing energy consumption"""
     # Data from COMPUTER_COMPARISONS energy baseline
     operations = ['Idle', 'Basic', 'Medium', 'Complex']
-    computers = ['Classical', 'Quantum']
 
     classical_energy = [65, 150, 250, 350]  # From DOE data
     quantum_energy = [1500, 15000, 21000, 27000]  # From Google Quantum AI Lab
@@ -123,137 +111,109 @@ def create_energy_3d_bars():
     x_quantum = [1] * len(operations)
     y_positions = list(range(len(operations)))
 
-    fig = go.Figure()
-
-    # Classical computer trace
-    fig.add_trace(go.Scatter3d(
-        x=x_classical,
-        y=y_positions,
-        z=classical_energy,
-        mode='lines+markers',
-        name='Classical',
-        line=dict(color='blue', width=10),
-        marker=dict(size=8, color='blue')
-    ))
-
-    # Quantum computer trace
-    fig.add_trace(go.Scatter3d(
-        x=x_quantum,
-        y=y_positions,
-        z=quantum_energy,
-        mode='lines+markers',
-        name='Quantum',
-        line=dict(color='orange', width=10),
-        marker=dict(size=8, color='orange')
-    ))
-
-    fig.update_layout(
-        title='Energy Consumption Across Operation Types',
-        scene=dict(
-            xaxis=dict(
-                title='Computer Type',
-                ticktext=['Classical', 'Quantum'],
-                tickvals=[0, 1],
-                range=[-0.5, 1.5]
-            ),
-            yaxis=dict(
-                title='Operation Complexity',
-                ticktext=operations,
-                tickvals=list(range(len(operations)))
-            ),
-            zaxis=dict(
-                title='Energy (Watts)',
-                type='log'
-            ),
-        ),
-        width=800,
-        height=800,
-        showlegend=True
-    )
-
-    return fig
+    traces = [
+        # Classical computer trace
+        {
+            'type': 'scatter3d',
+            'x': x_classical,
+            'y': y_positions,
+            'z': classical_energy,
+            'mode': 'lines+markers',
+            'name': 'Classical',
+            'line': {'color': 'blue', 'width': 10},
+            'marker': {'size': 8, 'color': 'blue'}
+        },
+        # Quantum computer trace
+        {
+            'type': 'scatter3d',
+            'x': x_quantum,
+            'y': y_positions,
+            'z': quantum_energy,
+            'mode': 'lines+markers',
+            'name': 'Quantum',
+            'line': {'color': 'orange', 'width': 10},
+            'marker': {'size': 8, 'color': 'orange'}
+        }
+    ]
+
+    return make_figure(traces, template='energy_3d')
+
+def _scaling_traces(x, classical_times, quantum_times):
+    return [
+        {
+            'type': 'scatter',
+            'x': x,
+            'y': classical_times,
+            'mode': 'lines+markers',
+            'name': 'Classical',
+            'line': {'color': 'blue'}
+        },
+        {
+            'type': 'scatter',
+            'x': x,
+            'y': quantum_times,
+            'mode': 'lines+markers',
+            'name': 'Quantum',
+            'line': {'color': 'orange'}
+        }
+    ]
 
 def create_interactive_scaling_animation(algorithm_type="Search"):
     """Create an animated 2D scatter plot showing computational scaling"""
-    frames = []
     problem_sizes = np.linspace(1, 100, 50)
 
-    scaling_functions = {
-        "Search": {
-            "classical": lambda n: n,  # O(n)
-            "quantum": lambda n: np.sqrt(n)  # O(√n)
-        },
-        "Factoring": {
-            "classical": lambda n: np.exp(np.sqrt(n)),  # Exponential
-            "quantum": lambda n: np.log2(n)**2  # Polynomial
-        }
-    }
-
-    # Create frames for animation
-    for i in range(len(problem_sizes)):
-        classical_times = scaling_functions[algorithm_type]["classical"](problem_sizes[:i+1])
-        quantum_times = scaling_functions[algorithm_type]["quantum"](problem_sizes[:i+1])
-
-        frame = go.Frame(
-            data=[
-                go.Scatter(
-                    x=problem_sizes[:i+1],
-                    y=classical_times,
-                    mode='lines+markers',
-                    name='Classical',
-                    line=dict(color='blue')
-                ),
-                go.Scatter(
-                    x=problem_sizes[:i+1],
-                    y=quantum_times,
-                    mode='lines+markers',
-                    name='Quantum',
-                    line=dict(color='orange')
-                )
-            ]
-        )
-        frames.append(frame)
-
-    # Create the base figure
-    fig = go.Figure(
+    # Each frame shows a growing prefix of the full curves
+    classical_times = ANIMATION_SCALING[algorithm_type]["classical"](problem_sizes)
+    quantum_times = ANIMATION_SCALING[algorithm_type]["quantum"](problem_sizes)
+    frames = [
+        {'data': _scaling_traces(problem_sizes[:i+1], classical_times[:i+1], quantum_times[:i+1])}
+        for i in range(len(problem_sizes))
+    ]
+
+    # Initial data is the first point only
+    return make_figure(
+        _scaling_traces(problem_sizes[:1], classical_times[:1], quantum_times[:1]),
+        template='scaling_animation',
         frames=frames,
-        layout=go.Layout(
-            title=f'Algorithm Scaling: {algorithm_type}',
-            xaxis=dict(title='Problem Size', range=[0, 100]),
-            yaxis=dict(title='Computation Time', type='log'),
-            updatemenus=[dict(
-                type='buttons',
-                showactive=False,
-                buttons=[
-                    dict(label='Play',
-                         method='animate',
-                         args=[None, {'frame': {'duration': 50, 'redraw': True},
-                                    'fromcurrent': True}]),
-                    dict(label='Pause',
-                         method='animate',
-                         args=[[None], {'frame': {'duration': 0, 'redraw': False},
-                                      'mode': 'immediate',
-                                      'transition': {'duration': 0}}])
-                ]
-            )]
-        )
+        title=figure_title(f'Algorithm Scaling: {algorithm_type}')
     )
 
-    # Add the initial data
-    fig.add_trace(go.Scatter(
-        x=[problem_sizes[0]],
-        y=[scaling_functions[algorithm_type]["classical"](problem_sizes[0])],
-        mode='lines+markers',
-        name='Classical',
-        line=dict(color='blue')
-    ))
-
-    fig.add_trace(go.Scatter(
-        x=[problem_sizes[0]],
-        y=[scaling_functions[algorithm_type]["quantum"](problem_sizes[0])],
-        mode='lines+markers',
-        name='Quantum',
-        line=dict(color='orange')
-    ))
+def create_stored_runs_chart(curves, title, y_label):
+    """Create a line chart with one curve per stored (backend, params) configuration"""
+    traces = []
+    for (backend, params), (sizes, values) in curves.items():
+        label = ', '.join(f'{k}={v}' for k, v in json.loads(params).items())
+        traces.append({
+            'type': 'scatter',
+            'x': sizes,
+            'y': values,
+            'mode': 'lines+markers',
+            'name': f'{backend} ({label})' if label else backend
+        })
+
+    return make_figure(
+        traces,
+        title=figure_title(title),
+        xaxis=axis('Problem Size'),
+        yaxis=axis(y_label, type='log')
+    )
 
-    return fig
\ No newline at end of file
+def create_fidelity_decay_chart(depths, strengths, fidelity):
+    """Create a line chart of fidelity against circuit depth, one curve per noise strength"""
+    traces = [
+        {
+            'type': 'scatter',
+            'x': depths,
+            'y': curve,
+            'mode': 'lines',
+            'name': f'p = {strength:g}'
+        }
+        for strength, curve in zip(strengths, fidelity)
+    ]
+
+    return make_figure(
+        traces,
+        title=figure_title('Noisy Circuit Fidelity Decay'),
+        xaxis=axis('Circuit Depth (layers)'),
+        yaxis=axis('Fidelity with Ideal State', range=[0, 1.05])
+    )
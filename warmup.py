@@ -0,0 +1,123 @@
+"""
+Background warm-up of the expensive figures and arrays used by the app.
+
+Streamlit re-executes the page script on every interaction, so the first
+visitor after a deploy would otherwise pay for building every 3D chart and
+animation. `start()` is called by serve.py before the server starts (or by
+the page script on the first session under `streamlit run`) and builds the
+known-expensive items on a background thread pool, in the order the page
+renders them; progress is logged and shown in the sidebar via `status()`.
+`fetch()` returns a cached result, waits on an item that is still warming
+instead of building it twice, and builds anything else inline.
+"""
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from streamlit.logger import get_logger
+
+import utils
+from models import noise, scaling
+
+# Streamlit's logger setup gives this a handler; plain loggers are dropped
+logger = get_logger(__name__)
+
+# Builders and arguments in priority order (the order the tabs render them)
+WARMUP_ITEMS = [
+    (noise.radar_scores, ()),
+    (utils.create_3d_performance_surface, ()),
+    (utils.create_interactive_scaling_animation, ("Search",)),
+    (utils.create_energy_3d_bars, ()),
+    (scaling.compute_algorithm_scaling, ()),
+    (utils.create_interactive_scaling_animation, ("Factoring",)),
+    (noise.fidelity_sweep, ()),
+]
+
+_lock = threading.Lock()
+_results = {}
+_executor = None
+_progress = {'total': 0, 'done': 0, 'failed': 0, 'started_at': None, 'finished_at': None}
+
+
+def _key(builder, args):
+    return (builder.__name__, args)
+
+
+def _claim(builder, args):
+    """Return (future, owner) for an item; owner is True if the caller must build it"""
+    key = _key(builder, args)
+    with _lock:
+        future = _results.get(key)
+        if future is not None:
+            return future, False
+        future = Future()
+        _results[key] = future
+        return future, True
+
+
+def _build(builder, args, future):
+    start = time.perf_counter()
+    try:
+        result = builder(*args)
+    except BaseException as exc:
+        # Drop the failed entry so the next request retries it
+        with _lock:
+            _results.pop(_key(builder, args), None)
+        future.set_exception(exc)
+        raise
+    future.set_result(result)
+    logger.info("Built %s%s in %.3fs", builder.__name__, args, time.perf_counter() - start)
+    return result
+
+
+def _warm(builder, args):
+    future, owner = _claim(builder, args)
+    try:
+        if owner:
+            _build(builder, args, future)
+        else:
+            future.result()
+    except Exception:
+        logger.exception("Warm-up of %s%s failed", builder.__name__, args)
+        with _lock:
+            _progress['failed'] += 1
+    finally:
+        with _lock:
+            _progress['done'] += 1
+            done, total = _progress['done'], _progress['total']
+            if done == total:
+                _progress['finished_at'] = time.time()
+        logger.info("Warm-up progress: %d/%d", done, total)
+
+
+def start(max_workers=2):
+    """Start warming the expensive items in the background (idempotent)"""
+    global _executor
+    with _lock:
+        if _executor is not None:
+            return
+        _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="warmup")
+        _progress['total'] = len(WARMUP_ITEMS)
+        _progress['started_at'] = time.time()
+    logger.info("Starting warm-up of %d items", len(WARMUP_ITEMS))
+    for builder, args in WARMUP_ITEMS:
+        _executor.submit(_warm, builder, args)
+
+
+def fetch(builder, *args):
+    """Return builder(*args), sharing a finished or in-flight warm-up result"""
+    future, owner = _claim(builder, args)
+    if owner:
+        return _build(builder, args, future)
+    return future.result()
+
+
+def status():
+    """Return a snapshot of warm-up progress for instrumentation"""
+    with _lock:
+        snapshot = dict(_progress)
+        snapshot['cached'] = sorted(
+            f"{name}{args}" for (name, args), future in _results.items() if future.done()
+        )
+    snapshot['complete'] = snapshot['total'] > 0 and snapshot['done'] == snapshot['total']
+    return snapshot